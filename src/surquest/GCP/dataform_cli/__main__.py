@@ -1,16 +1,116 @@
 import argparse
+import math
 import sys
-from .push import push
+from contextlib import nullcontext
+from .push import push, finalize
 from .pull import pull
+from .clone import clone
+from .compile import compile_workspace
+from .run import run
 from .logger import get_fixed_width_logger
+from .profiler import PROFILERS, profile
+from .handlers.shard_handler import ShardHandler
+from .handlers.workflow_handler import WorkflowHandler
+
+def positive_int(value):
+    """
+    Parses a command line argument as a positive integer.
+
+    Args:
+        value (str): Raw argument value.
+
+    Returns:
+        int: The parsed value.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from None
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+
+    return number
+
+
+def positive_float(value):
+    """
+    Parses a command line argument as a positive number.
+
+    Args:
+        value (str): Raw argument value.
+
+    Returns:
+        float: The parsed value.
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: '{value}'") from None
+
+    if not (number > 0 and math.isfinite(number)):
+        raise argparse.ArgumentTypeError(f"must be a positive finite number, got {value}")
+
+    return number
+
+
+def shard_spec(value):
+    """
+    Parses a command line argument as a shard specification in the form 'i/N'.
+
+    Args:
+        value (str): Raw argument value.
+
+    Returns:
+        ShardHandler: The shard handler.
+    """
+    try:
+        return ShardHandler.from_spec(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def target_spec(value):
+    """
+    Validates a command line argument as an action target in the form '[[database.]schema.]name'.
+
+    Args:
+        value (str): Raw argument value.
+
+    Returns:
+        str: The unchanged target, parsed again when the invocation is configured.
+    """
+    try:
+        WorkflowHandler.parse_target(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+    return value
+
+
+def add_path_filter_arguments(parser):
+    """
+    Adds repeatable arguments limiting a command to selected subtrees and files.
+
+    Args:
+        parser (argparse.ArgumentParser): Subcommand parser to extend.
+    """
+    parser.add_argument("--path", action="append", help="Subtree to synchronize, relative to the repository root (repeatable)")
+    parser.add_argument("--include", action="append", help="Glob pattern of files to synchronize (repeatable)")
+    parser.add_argument("--exclude", action="append", help="Glob pattern of files not to synchronize (repeatable)")
+
 
 def main():
     logger = get_fixed_width_logger()
 
     parser = argparse.ArgumentParser(
-        description="Dataform CLI for pushing and pulling workspace files."
+        description="Dataform CLI for pushing, pulling, cloning, compiling and running workspace files."
     )
 
+    parser.add_argument("--profile", choices=PROFILERS, help="Profile the command with cProfile (main thread only) or tracemalloc (peak memory of all threads)")
+    parser.add_argument("--profile-output", help="Path of the profiling output file (defaults to dataform-cli.prof or dataform-cli.tracemalloc)")
+    parser.add_argument("--profile-top", type=positive_int, default=20, help="Number of entries in the logged profiling summary")
+
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # Push command parser
@@ -23,6 +123,11 @@ def main():
     push_parser.add_argument("--no-delete-remote-files", action="store_true", help="Do not delete remote files not in local source")
     push_parser.add_argument("--no-autocommit", action="store_true", help="Do not auto-commit after push")
     push_parser.add_argument("--no-autopush", action="store_true", help="Do not auto-push git commits")
+    push_parser.add_argument("--no-listing-cache", action="store_true", help="Always crawl the remote workspace instead of using cached listings")
+    push_parser.add_argument("--cache-dir", help="Path to local cache directory (defaults to ~/.cache/dataform-cli)")
+    add_path_filter_arguments(push_parser)
+    push_parser.add_argument("--shard", type=shard_spec, help="Upload only shard i/N of the files (e.g. 2/4); run finalize after all shards")
+    push_parser.add_argument("--mirror", action="store_true", help="Reset the workspace and rebuild it from local source instead of deleting stale files one by one")
 
     # Pull command parser
     pull_parser = subparsers.add_parser("pull", help="Pull files from Dataform workspace to local directory.")
@@ -31,9 +136,97 @@ def main():
     pull_parser.add_argument("--repository-id", required=True, help="ID of the Dataform repository")
     pull_parser.add_argument("--workspace-id", required=True, help="ID of the Dataform workspace")
     pull_parser.add_argument("--target-dir", required=True, help="Path to local target directory")
+    pull_parser.add_argument("--no-listing-cache", action="store_true", help="Always crawl the remote workspace instead of using cached listings")
+    pull_parser.add_argument("--cache-dir", help="Path to local cache directory (defaults to ~/.cache/dataform-cli)")
+    add_path_filter_arguments(pull_parser)
+    pull_parser.add_argument("--shard", type=shard_spec, help="Download only shard i/N of the files (e.g. 2/4)")
+
+    # Finalize command parser
+    finalize_parser = subparsers.add_parser("finalize", help="Finish a sharded push: delete stale files, clean up, commit and push.")
+    finalize_parser.add_argument("--project-id", required=True, help="Google Cloud project ID")
+    finalize_parser.add_argument("--region", required=True, help="Region of the Dataform repository")
+    finalize_parser.add_argument("--repository-id", required=True, help="ID of the Dataform repository")
+    finalize_parser.add_argument("--workspace-id", required=True, help="ID of the Dataform workspace")
+    finalize_parser.add_argument("--source-dir", required=True, help="Path to local source directory")
+    finalize_parser.add_argument("--no-delete-remote-files", action="store_true", help="Do not delete remote files not in local source")
+    finalize_parser.add_argument("--no-autocommit", action="store_true", help="Do not auto-commit")
+    finalize_parser.add_argument("--no-autopush", action="store_true", help="Do not auto-push git commits")
+    finalize_parser.add_argument("--no-listing-cache", action="store_true", help="Always crawl the remote workspace instead of using cached listings")
+    finalize_parser.add_argument("--cache-dir", help="Path to local cache directory (defaults to ~/.cache/dataform-cli)")
+    add_path_filter_arguments(finalize_parser)
+
+    # Clone command parser
+    clone_parser = subparsers.add_parser("clone", help="Copy files between Dataform workspaces without using local disk.")
+    clone_parser.add_argument("--project-id", required=True, help="Google Cloud project ID")
+    clone_parser.add_argument("--region", required=True, help="Region of the Dataform repository")
+    clone_parser.add_argument("--repository-id", required=True, help="ID of the Dataform repository")
+    clone_parser.add_argument("--from", dest="from_workspace_id", required=True, help="ID of the source Dataform workspace")
+    clone_parser.add_argument("--to", dest="to_workspace_id", required=True, help="ID of the target Dataform workspace")
+    clone_parser.add_argument("--to-repository-id", help="ID of the Dataform repository of the target workspace (defaults to --repository-id)")
+    clone_parser.add_argument("--workers", type=positive_int, default=8, help="Number of concurrent readers and writers")
+    clone_parser.add_argument("--no-delete-remote-files", action="store_true", help="Do not delete target files not in source workspace")
+    clone_parser.add_argument("--no-autocommit", action="store_true", help="Do not auto-commit after clone")
+    clone_parser.add_argument("--no-autopush", action="store_true", help="Do not auto-push git commits")
+    add_path_filter_arguments(clone_parser)
+
+    # Compile command parser
+    compile_parser = subparsers.add_parser("compile", help="Compile Dataform workspace, reusing results for unchanged content.")
+    compile_parser.add_argument("--project-id", required=True, help="Google Cloud project ID")
+    compile_parser.add_argument("--region", required=True, help="Region of the Dataform repository")
+    compile_parser.add_argument("--repository-id", required=True, help="ID of the Dataform repository")
+    compile_parser.add_argument("--workspace-id", required=True, help="ID of the Dataform workspace")
+    compile_parser.add_argument("--source-dir", help="Path to local source directory last pushed to the workspace (required for the compilation cache)")
+    compile_parser.add_argument("--no-compilation-cache", action="store_true", help="Always create a new compilation result")
+    compile_parser.add_argument("--cache-dir", help="Path to local cache directory (defaults to ~/.cache/dataform-cli)")
+
+    # Run command parser
+    run_parser = subparsers.add_parser("run", help="Compile Dataform workspace and run workflow invocations concurrently.")
+    run_parser.add_argument("--project-id", required=True, help="Google Cloud project ID")
+    run_parser.add_argument("--region", required=True, help="Region of the Dataform repository")
+    run_parser.add_argument("--repository-id", required=True, help="ID of the Dataform repository")
+    run_parser.add_argument("--workspace-id", required=True, help="ID of the Dataform workspace")
+    run_parser.add_argument("--tag", action="append", help="Tag to run in its own workflow invocation (repeatable)")
+    run_parser.add_argument("--target", type=target_spec, action="append", help="Target [[database.]schema.]name to run in its own workflow invocation (repeatable)")
+    run_parser.add_argument("--include-dependencies", action="store_true", help="Also run transitive dependencies of selected actions")
+    run_parser.add_argument("--include-dependents", action="store_true", help="Also run transitive dependents of selected actions")
+    run_parser.add_argument("--full-refresh", action="store_true", help="Fully refresh incremental tables")
+    run_parser.add_argument("--source-dir", help="Path to local source directory last pushed to the workspace (required for the compilation cache)")
+    run_parser.add_argument("--no-compilation-cache", action="store_true", help="Always create a new compilation result")
+    run_parser.add_argument("--cache-dir", help="Path to local cache directory (defaults to ~/.cache/dataform-cli)")
+    run_parser.add_argument("--poll-interval", type=positive_float, default=2.0, help="Initial polling interval in seconds")
+    run_parser.add_argument("--max-poll-interval", type=positive_float, default=30.0, help="Maximal polling interval in seconds")
 
     args = parser.parse_args()
 
+    if args.command == "push" and args.mirror:
+        if args.shard or args.include or args.exclude or args.no_delete_remote_files:
+            push_parser.error("--mirror cannot be combined with --shard, --include, --exclude or --no-delete-remote-files")
+
+    if args.command == "run" and args.max_poll_interval < args.poll_interval:
+        run_parser.error("--max-poll-interval must not be smaller than --poll-interval")
+
+    profiling = nullcontext()
+    if args.profile:
+        profiling = profile(
+            profiler=args.profile,
+            output_path=args.profile_output,
+            top=args.profile_top,
+            logger=logger
+        )
+
+    with profiling:
+        run_command(args, parser, logger)
+
+
+def run_command(args, parser, logger):
+    """
+    Runs the subcommand selected on the command line.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+        parser (argparse.ArgumentParser): Parser used to print help for unknown commands.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
     if args.command == "push":
         logger.info("Starting push operation...")
         push(
@@ -45,6 +238,13 @@ def main():
             delete_remote_files=not args.no_delete_remote_files,
             autocommit=not args.no_autocommit,
             autopush=not args.no_autopush,
+            use_listing_cache=not args.no_listing_cache,
+            cache_dir=args.cache_dir,
+            paths=args.path,
+            include=args.include,
+            exclude=args.exclude,
+            shard=args.shard,
+            mirror=args.mirror,
             logger=logger
         )
 
@@ -56,8 +256,91 @@ def main():
             repository_id=args.repository_id,
             workspace_id=args.workspace_id,
             target_dir=args.target_dir,
+            use_listing_cache=not args.no_listing_cache,
+            cache_dir=args.cache_dir,
+            paths=args.path,
+            include=args.include,
+            exclude=args.exclude,
+            shard=args.shard,
+            logger=logger
+        )
+
+    elif args.command == "finalize":
+        logger.info("Starting finalize operation...")
+        finalize(
+            project_id=args.project_id,
+            region=args.region,
+            repository_id=args.repository_id,
+            workspace_id=args.workspace_id,
+            source_dir=args.source_dir,
+            delete_remote_files=not args.no_delete_remote_files,
+            autocommit=not args.no_autocommit,
+            autopush=not args.no_autopush,
+            use_listing_cache=not args.no_listing_cache,
+            cache_dir=args.cache_dir,
+            paths=args.path,
+            include=args.include,
+            exclude=args.exclude,
+            logger=logger
+        )
+
+    elif args.command == "clone":
+        logger.info("Starting clone operation...")
+        succeeded = clone(
+            project_id=args.project_id,
+            region=args.region,
+            repository_id=args.repository_id,
+            source_workspace_id=args.from_workspace_id,
+            target_workspace_id=args.to_workspace_id,
+            target_repository_id=args.to_repository_id,
+            delete_remote_files=not args.no_delete_remote_files,
+            autocommit=not args.no_autocommit,
+            autopush=not args.no_autopush,
+            workers=args.workers,
+            paths=args.path,
+            include=args.include,
+            exclude=args.exclude,
+            logger=logger
+        )
+        if not succeeded:
+            sys.exit(1)
+
+    elif args.command == "compile":
+        logger.info("Starting compile operation...")
+        _, errors = compile_workspace(
+            project_id=args.project_id,
+            region=args.region,
+            repository_id=args.repository_id,
+            workspace_id=args.workspace_id,
+            source_dir=args.source_dir,
+            use_compilation_cache=not args.no_compilation_cache,
+            cache_dir=args.cache_dir,
+            logger=logger
+        )
+        if errors:
+            sys.exit(1)
+
+    elif args.command == "run":
+        logger.info("Starting run operation...")
+        succeeded = run(
+            project_id=args.project_id,
+            region=args.region,
+            repository_id=args.repository_id,
+            workspace_id=args.workspace_id,
+            tags=args.tag,
+            targets=args.target,
+            source_dir=args.source_dir,
+            include_dependencies=args.include_dependencies,
+            include_dependents=args.include_dependents,
+            full_refresh=args.full_refresh,
+            use_compilation_cache=not args.no_compilation_cache,
+            cache_dir=args.cache_dir,
+            poll_interval=args.poll_interval,
+            max_poll_interval=args.max_poll_interval,
             logger=logger
         )
+        if not succeeded:
+            sys.exit(1)
 
     else:
         logger.error("Unknown command")
@@ -0,0 +1,221 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core import exceptions
+from .handlers.gitignore_handler import GitignoreHandler
+from .handlers.path_filter_handler import PathFilterHandler
+from .handlers.pull_handler import PullHandler
+from .handlers.push_handler import PushHandler
+from .logger import get_fixed_width_logger
+from .push import remove_stale_files, remove_empty_directories
+
+# Marks the end of the transfer queue for writer threads
+_END_OF_QUEUE = object()
+
+
+def clone(
+        project_id,
+        region,
+        repository_id,
+        source_workspace_id,
+        target_workspace_id,
+        target_repository_id=None,
+        delete_remote_files=True,
+        autocommit=True,
+        autopush=True,
+        workers=8,
+        paths=None,
+        include=None,
+        exclude=None,
+        logger=get_fixed_width_logger(name="cloneLogger")
+    ):
+    """
+    Copies all files from one Google Cloud Dataform workspace to another without touching the local disk.
+
+    File contents are read from the source workspace and written to the target workspace by
+    concurrent reader and writer threads connected through a bounded in-memory queue.
+    The `.gitignore` file of the source workspace is applied to both workspaces, files missing
+    in the source can be deleted from the target, and the result can be committed and pushed.
+
+    Args:
+        project_id (str): The Google Cloud project ID where the Dataform repositories reside.
+        region (str): The region in which the Dataform repositories are hosted.
+        repository_id (str): The ID of the Dataform repository holding the source workspace.
+        source_workspace_id (str): The ID of the workspace to copy files from.
+        target_workspace_id (str): The ID of the workspace to copy files to.
+        target_repository_id (str, optional): The ID of the repository holding the target workspace.
+            Defaults to `repository_id`.
+        delete_remote_files (bool): If True, removes files from the target workspace
+            that are not present in the source workspace. Defaults to True.
+        autocommit (bool): If True, automatically commits the changes in the target workspace. Defaults to True.
+        autopush (bool): If True, automatically pushes the committed changes to the remote repository. Defaults to True.
+        workers (int): Number of concurrent reader threads and of concurrent writer threads. Defaults to 8.
+        paths (List[str], optional): Subtrees to clone, relative to the repository root.
+            Crawls and deletions are limited to them. Defaults to the whole repository.
+        include (List[str], optional): Glob patterns of files to clone. Defaults to all files.
+        exclude (List[str], optional): Glob patterns of files not to clone. Defaults to no files.
+        logger (logging.Logger): Logger instance for structured logging. A default fixed-width logger is used if not provided.
+
+    Returns:
+        bool: True if every file was transferred, False if any file failed.
+    """
+    source_workspace_path = PullHandler.get_workspace_path(
+        project_id, region, repository_id, source_workspace_id
+    )
+    target_workspace_path = PushHandler.get_workspace_path(
+        project_id, region, target_repository_id or repository_id, target_workspace_id
+    )
+
+    logger.info(f"Cloning files from workspace: {source_workspace_path}")
+    logger.info(f"Cloning files to workspace: {target_workspace_path}")
+
+    path_filter = PathFilterHandler(paths=paths, include=include, exclude=exclude)
+    if path_filter.paths:
+        logger.info(f"Limiting clone to: {', '.join(path_filter.paths)}")
+
+    # Attempt to read .gitignore from the source workspace
+    try:
+        logger.debug("Fetching .gitignore from source workspace...")
+        gitignore_handler = GitignoreHandler(
+            content=PullHandler.pull_file(
+                file_path=".gitignore",
+                workspace_path=source_workspace_path
+            )
+        )
+        logger.info(".gitignore file found in source workspace")
+    except exceptions.NotFound:
+        logger.warning("No .gitignore file found in source workspace. Proceeding without ignore rules.")
+        gitignore_handler = None
+
+    logger.info("Retrieving source files...")
+    source_files = PullHandler.get_workspace_files(
+        workspace_path=source_workspace_path,
+        gitignore_handler=gitignore_handler,
+        path_filter=path_filter
+    )
+
+    logger.info("Retrieving target files...")
+    try:
+        target_files = PullHandler.get_workspace_files(
+            workspace_path=target_workspace_path,
+            gitignore_handler=gitignore_handler,
+            path_filter=path_filter
+        )
+    except exceptions.GoogleAPICallError as e:
+        logger.error(f"Failed to list target files: {e}")
+        target_files = []
+
+    logger.info(f"{len(source_files)} source files, {len(target_files)} target files")
+
+    failed_files = transfer_files(
+        file_paths=source_files,
+        source_workspace_path=source_workspace_path,
+        target_workspace_path=target_workspace_path,
+        workers=workers,
+        logger=logger
+    )
+
+    if failed_files:
+        logger.error(f"Failed to clone {len(failed_files)} files, skipping cleanup and commit")
+        return False
+
+    # Delete target files not present in the source workspace
+    if delete_remote_files:
+        remove_stale_files(
+            remote_files=target_files,
+            local_files=source_files,
+            workspace_path=target_workspace_path,
+            logger=logger
+        )
+
+    remove_empty_directories(
+        workspace_path=target_workspace_path,
+        gitignore_handler=gitignore_handler,
+        path_filter=path_filter,
+        logger=logger
+    )
+
+    # Commit changes if enabled
+    if autocommit:
+        logger.info("Committing workspace changes...")
+        PushHandler.commit_workspace_changes(
+            target_workspace_path,
+            message=f"Automated clone from workspace {source_workspace_id}"
+        )
+
+    # Push commits if enabled
+    if autopush:
+        logger.info("Pushing git commits...")
+        PushHandler.push_git_commits(target_workspace_path)
+
+    logger.info("Clone completed successfully.")
+    return True
+
+
+def transfer_files(file_paths, source_workspace_path, target_workspace_path, workers, logger):
+    """
+    Streams files from the source workspace to the target workspace through a bounded queue.
+
+    Reader threads download file contents and put them on the queue, writer threads take them
+    off the queue and upload them. The queue holds at most two files per writer, which keeps
+    memory usage bounded regardless of the repository size.
+
+    Args:
+        file_paths (List[str]): Relative paths of files to transfer.
+        source_workspace_path (str): Fully qualified path of the workspace to read from.
+        target_workspace_path (str): Fully qualified path of the workspace to write to.
+        workers (int): Number of concurrent reader threads and of concurrent writer threads.
+        logger (logging.Logger): Logger instance for structured logging.
+
+    Returns:
+        List[str]: Relative paths of files that failed to transfer.
+    """
+    if workers < 1:
+        raise ValueError(f"Number of workers must be positive, got {workers}")
+
+    transfer_queue = queue.Queue(maxsize=2 * workers)
+    failed_files = []
+    failed_lock = threading.Lock()
+
+    def read_file(file_path):
+        try:
+            file_content = PullHandler.pull_file(
+                file_path=file_path,
+                workspace_path=source_workspace_path
+            )
+        except Exception as e:
+            logger.error(f"Failed to read {file_path}: {e}")
+            with failed_lock:
+                failed_files.append(file_path)
+            return
+
+        transfer_queue.put((file_path, file_content))
+
+    def write_files():
+        while True:
+            item = transfer_queue.get()
+            if item is _END_OF_QUEUE:
+                return
+
+            file_path, file_content = item
+            logger.info(f"Cloning file: {file_path}")
+            try:
+                PushHandler.write_file_contents(file_content, file_path, target_workspace_path)
+            except Exception as e:
+                logger.error(f"Failed to write {file_path}: {e}")
+                with failed_lock:
+                    failed_files.append(file_path)
+
+    writers = [threading.Thread(target=write_files, daemon=True) for _ in range(workers)]
+    for writer in writers:
+        writer.start()
+
+    with ThreadPoolExecutor(max_workers=workers) as readers:
+        list(readers.map(read_file, file_paths))
+
+    for _ in writers:
+        transfer_queue.put(_END_OF_QUEUE)
+    for writer in writers:
+        writer.join()
+
+    return sorted(failed_files)
@@ -0,0 +1,138 @@
+import hashlib
+import os
+from google.api_core import exceptions
+from .handlers.compilation_cache_handler import CompilationCacheHandler
+from .handlers.compile_handler import CompileHandler
+from .handlers.push_handler import PushHandler
+from .logger import get_fixed_width_logger
+
+
+def compile_workspace(
+        project_id,
+        region,
+        repository_id,
+        workspace_id,
+        source_dir=None,
+        use_compilation_cache=True,
+        cache_dir=None,
+        logger=get_fixed_width_logger(name="compileLogger")
+    ):
+    """
+    Compiles a Google Cloud Dataform workspace, reusing a previous compilation result
+    when the content of the workspace has not changed since.
+
+    The content is identified by a hash of all file paths and contents of `source_dir`,
+    combined with a hash of the Git status of the workspace (commits ahead and behind and
+    uncommitted file changes, see `CompileHandler.get_workspace_hash`). Hashing the workspace
+    files themselves would require reading every file through the API, so without `source_dir`
+    the cache is skipped and the workspace is always compiled.
+
+    `source_dir` must be exactly the content last pushed to the workspace, with every file
+    and without filters (no pending shards, `--path`, `--include`/`--exclude` or
+    `--no-delete-remote-files`). The Git status detects uncommitted edits made since, but not
+    edits which were committed and pushed from elsewhere afterwards.
+
+    Args:
+        project_id (str): The Google Cloud project ID where the Dataform repository resides.
+        region (str): The region in which the Dataform repository is hosted.
+        repository_id (str): The unique identifier of the Dataform repository.
+        workspace_id (str): The ID of the workspace to compile.
+        source_dir (str, optional): The path to the local directory last pushed to the workspace.
+            Required for the compilation cache.
+        use_compilation_cache (bool): If True, compilation results are cached on disk by content hash. Defaults to True.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        logger (logging.Logger): Logger instance for structured logging. A default fixed-width logger is used if not provided.
+
+    Returns:
+        Tuple[str, List[dict]]: The compilation result name and the list of compilation errors.
+    """
+    repository_path = CompileHandler.get_repository_path(project_id, region, repository_id)
+    workspace_path = CompileHandler.get_workspace_path(project_id, region, repository_id, workspace_id)
+
+    logger.info(f"Compiling workspace: {workspace_path}")
+
+    compilation_cache = None
+    cache_key = None
+    tree_hash = None
+    workspace_hash = None
+
+    if use_compilation_cache and not source_dir:
+        logger.info("No source directory given, skipping compilation cache")
+
+    elif use_compilation_cache:
+        logger.info(f"Hashing local files in: {os.path.abspath(source_dir)}")
+        tree_hash = get_local_tree_hash(source_dir)
+
+        try:
+            workspace_hash = CompileHandler.get_workspace_hash(workspace_path)
+        except exceptions.GoogleAPICallError as e:
+            logger.warning(f"Failed to fetch workspace status, skipping compilation cache: {e}")
+            workspace_hash = None
+
+    if tree_hash is not None and workspace_hash is not None:
+        # The local files only identify the workspace content together with its Git status
+        cache_key = hashlib.sha256(f"{tree_hash}\0{workspace_hash}".encode("utf-8")).hexdigest()
+
+        logger.debug(f"Tree hash: {tree_hash}, workspace hash: {workspace_hash}")
+        compilation_cache = CompilationCacheHandler(workspace_path, cache_dir=cache_dir)
+        cached_result = compilation_cache.get(cache_key)
+
+        if cached_result is not None:
+            try:
+                CompileHandler.get_compilation_result(cached_result["name"])
+                logger.info(f"Content unchanged, reusing compilation result: {cached_result['name']}")
+                log_compilation_errors(cached_result["errors"], logger)
+                return cached_result["name"], cached_result["errors"]
+
+            except exceptions.NotFound:
+                logger.warning(f"Cached compilation result no longer exists: {cached_result['name']}")
+                compilation_cache.remove(cache_key)
+
+    logger.info("Creating compilation result...")
+    compilation_result = CompileHandler.create_compilation_result(repository_path, workspace_path)
+    errors = CompileHandler.get_compilation_errors(compilation_result)
+
+    logger.info(f"Compilation result: {compilation_result.name}")
+    log_compilation_errors(errors, logger)
+
+    if compilation_cache is not None:
+        compilation_cache.set(cache_key, compilation_result.name, errors)
+
+    return compilation_result.name, errors
+
+
+def get_local_tree_hash(source_dir):
+    """
+    Computes the tree hash of all files in a local directory, as uploaded by `push`.
+
+    Args:
+        source_dir (str): Path to the local directory.
+
+    Returns:
+        str: Hex digest of the tree hash.
+    """
+    def read_file(relative_path):
+        with open(os.path.join(source_dir, relative_path), "rb") as f:
+            return relative_path, f.read()
+
+    return CompileHandler.get_tree_hash(
+        read_file(relative_path) for relative_path in PushHandler.get_local_files(source_dir)
+    )
+
+
+def log_compilation_errors(errors, logger):
+    """
+    Logs compilation errors, one line per error.
+
+    Args:
+        errors (List[dict]): Compilation errors as returned by `CompileHandler.get_compilation_errors`.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
+    if not errors:
+        logger.info("Compilation succeeded without errors.")
+        return
+
+    logger.error(f"Compilation failed with {len(errors)} errors:")
+    for error in errors:
+        location = error["path"] or error["action"] or "-"
+        logger.error(f"{location}: {error['message']}")
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dataform-cli")
+
+
+class CacheHandler:
+    """
+    Base class for JSON documents persisted in the local cache directory.
+
+    Each document is stored under `<cache_dir>/<namespace>/<sha256(key)>.json`.
+    Unreadable or corrupted documents are treated as missing so that a broken cache
+    never prevents the CLI from talking to the Dataform API directly.
+    """
+
+    namespace = "cache"
+
+    def __init__(self, key, cache_dir=None):
+        """
+        Initializes the handler for a single cache document.
+
+        Args:
+            key (str): Identifier of the cached document (e.g. a fully qualified workspace path).
+            cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        """
+        self.key = key
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        self.cache_path = os.path.join(self.cache_dir, self.namespace, f"{digest}.json")
+
+    def _read(self):
+        """
+        Reads the cache document from disk.
+
+        Returns:
+            dict or None: The stored document, or None if it is missing or unreadable.
+        """
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != self.key:
+            return None
+
+        return data
+
+    def _write(self, data):
+        """
+        Atomically writes the cache document to disk.
+
+        Args:
+            data (dict): JSON-serializable document to store.
+        """
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(dict(data, key=self.key), f)
+
+        os.replace(tmp_path, self.cache_path)
+
+    def _delete(self):
+        """
+        Removes the cache document from disk if it exists.
+        """
+        try:
+            os.remove(self.cache_path)
+        except FileNotFoundError:
+            pass
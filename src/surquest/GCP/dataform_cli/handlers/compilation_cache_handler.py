@@ -0,0 +1,71 @@
+from .cache_handler import CacheHandler
+
+
+class CompilationCacheHandler(CacheHandler):
+    """
+    Persistent cache of compilation results of a single Dataform workspace, keyed by content hash.
+
+    Only the most recent `max_entries` content hashes are kept.
+    """
+
+    namespace = "compilations"
+
+    def __init__(self, workspace_path, cache_dir=None, max_entries=20):
+        """
+        Initializes the compilation cache for the given workspace.
+
+        Args:
+            workspace_path (str): Fully qualified workspace path.
+            cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+            max_entries (int): Maximum number of cached compilation results. Defaults to 20.
+        """
+        super().__init__(key=workspace_path, cache_dir=cache_dir)
+        self.workspace_path = workspace_path
+        self.max_entries = max_entries
+
+    def get(self, content_hash):
+        """
+        Returns the cached compilation result for the given content hash.
+
+        Args:
+            content_hash (str): Hash identifying the compiled content (see `compile_workspace`).
+
+        Returns:
+            dict or None: Entry with 'name' and 'errors' keys, or None if not cached.
+        """
+        data = self._read() or {}
+        return data.get("results", {}).get(content_hash)
+
+    def set(self, content_hash, name, errors):
+        """
+        Stores the compilation result for the given content hash.
+
+        Args:
+            content_hash (str): Hash identifying the compiled content (see `compile_workspace`).
+            name (str): Fully qualified compilation result name.
+            errors (List[dict]): Compilation errors as returned by `CompileHandler.get_compilation_errors`.
+        """
+        data = self._read() or {}
+        results = data.get("results", {})
+
+        # Re-insert to keep the most recently stored entries last
+        results.pop(content_hash, None)
+        results[content_hash] = {"name": name, "errors": errors}
+
+        while len(results) > self.max_entries:
+            results.pop(next(iter(results)))
+
+        self._write({"results": results})
+
+    def remove(self, content_hash):
+        """
+        Drops the cached compilation result for the given content hash.
+
+        Args:
+            content_hash (str): Hash identifying the compiled content (see `compile_workspace`).
+        """
+        data = self._read() or {}
+        results = data.get("results", {})
+
+        if results.pop(content_hash, None) is not None:
+            self._write({"results": results})
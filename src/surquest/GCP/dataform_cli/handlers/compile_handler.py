@@ -0,0 +1,145 @@
+import hashlib
+from google.cloud import dataform_v1
+from google.api_core import exceptions
+from google.api_core import retry
+from .dataform_handler import DataformHandler
+
+# Retries compilation requests on transient errors with exponential backoff (1s, 2s, 4s, ... up to 30s)
+COMPILATION_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(
+        exceptions.ServiceUnavailable,
+        exceptions.DeadlineExceeded,
+        exceptions.TooManyRequests,
+        exceptions.InternalServerError,
+    ),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=600.0,
+)
+
+
+class CompileHandler(DataformHandler):
+    """
+    Handler class for compiling Google Cloud Dataform workspaces.
+    Inherits the Dataform API client setup from DataformHandler.
+    """
+
+    @staticmethod
+    def get_tree_hash(files):
+        """
+        Computes a hash identifying the content of a file tree.
+
+        The hash covers both file paths and file contents, so renaming a file changes it as well.
+
+        Args:
+            files (Iterable[Tuple[str, bytes]]): Pairs of relative file path and file content.
+
+        Returns:
+            str: Hex digest of the tree hash.
+        """
+        tree_hash = hashlib.sha256()
+
+        for file_path, file_contents in sorted(files):
+            file_hash = hashlib.sha256(file_contents).hexdigest()
+            tree_hash.update(f"{file_path}\0{file_hash}\n".encode("utf-8"))
+
+        return tree_hash.hexdigest()
+
+    @classmethod
+    def get_workspace_hash(cls, workspace_path):
+        """
+        Computes a hash identifying the Git status of a workspace.
+
+        The hash covers the number of commits the workspace is ahead of and behind its
+        remote branch, and the path, state and content of every uncommitted file change.
+        Only changed files are read, so the number of calls depends on the number of
+        uncommitted changes, not on the size of the workspace. Both calls are available
+        for workspaces of repositories connected to Git as well.
+
+        Args:
+            workspace_path (str): Fully qualified workspace path.
+
+        Returns:
+            str: Hex digest of the workspace hash.
+        """
+        request = dataform_v1.FetchGitAheadBehindRequest(name=workspace_path)
+        ahead_behind = cls.dataform_client.fetch_git_ahead_behind(request=request)
+
+        request = dataform_v1.FetchFileGitStatusesRequest(name=workspace_path)
+        response = cls.dataform_client.fetch_file_git_statuses(request=request)
+
+        workspace_hash = hashlib.sha256()
+        workspace_hash.update(f"{ahead_behind.commits_ahead}\0{ahead_behind.commits_behind}\n".encode("utf-8"))
+
+        for change in sorted(response.uncommitted_file_changes, key=lambda change: change.path):
+            file_hash = ""
+            if change.state.name != "DELETED":
+                request = dataform_v1.ReadFileRequest(workspace=workspace_path, path=change.path)
+                file_contents = cls.dataform_client.read_file(request=request).file_contents
+                file_hash = hashlib.sha256(file_contents).hexdigest()
+
+            workspace_hash.update(f"{change.path}\0{change.state.name}\0{file_hash}\n".encode("utf-8"))
+
+        return workspace_hash.hexdigest()
+
+    @classmethod
+    def create_compilation_result(cls, repository_path, workspace_path):
+        """
+        Compiles the current content of a workspace.
+
+        The Dataform API compiles synchronously, so the returned result already contains
+        any compilation errors. Transient API errors are retried with exponential backoff.
+
+        Args:
+            repository_path (str): Fully qualified repository path.
+            workspace_path (str): Fully qualified workspace path.
+
+        Returns:
+            dataform_v1.CompilationResult: The created compilation result.
+        """
+        request = dataform_v1.CreateCompilationResultRequest(
+            parent=repository_path,
+            compilation_result=dataform_v1.CompilationResult(workspace=workspace_path)
+        )
+
+        return cls.dataform_client.create_compilation_result(request=request, retry=COMPILATION_RETRY)
+
+    @classmethod
+    def get_compilation_result(cls, name):
+        """
+        Fetches an existing compilation result.
+
+        Args:
+            name (str): Fully qualified compilation result name.
+
+        Returns:
+            dataform_v1.CompilationResult: The compilation result.
+        """
+        request = dataform_v1.GetCompilationResultRequest(name=name)
+
+        return cls.dataform_client.get_compilation_result(request=request, retry=COMPILATION_RETRY)
+
+    @staticmethod
+    def get_compilation_errors(compilation_result):
+        """
+        Converts compilation errors into JSON-serializable dictionaries.
+
+        Args:
+            compilation_result (dataform_v1.CompilationResult): The compilation result.
+
+        Returns:
+            List[dict]: Errors with 'path', 'action' and 'message' keys.
+        """
+        errors = []
+
+        for error in compilation_result.compilation_errors:
+            target = error.action_target
+            action = ".".join(part for part in (target.database, target.schema, target.name) if part)
+            errors.append({
+                "path": error.path,
+                "action": action,
+                "message": error.message,
+            })
+
+        return errors
@@ -19,4 +19,13 @@ class DataformHandler:
             region,
             repository_id,
             workspace_id
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def get_repository_path(cls, project_id, region, repository_id):
+
+        return cls.dataform_client.repository_path(
+            project_id,
+            region,
+            repository_id
+        )
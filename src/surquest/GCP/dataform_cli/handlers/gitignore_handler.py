@@ -18,33 +18,56 @@ class GitignoreHandler:
         or nested .gitignore files. Use `pathspec` for full support.
     """
 
-    def __init__(self, gitignore_path=".gitignore"):
+    def __init__(self, gitignore_path=".gitignore", content=None):
         """
         Initializes the IgnoreHandler with a specified .gitignore file.
 
         Args:
             gitignore_path (str or Path): Path to the .gitignore file. Defaults to '.gitignore'.
+            content (str or bytes, optional): Contents of the .gitignore file. When provided,
+                patterns are parsed from it and nothing is read from disk.
         """
         self.gitignore_path = Path(gitignore_path)
         self.base_dir = self.gitignore_path.parent.resolve()
-        self.patterns = self._load_patterns()
+        self.patterns = self._load_patterns(content)
 
-    def _load_patterns(self):
+    def _load_patterns(self, content=None):
         """
-        Loads ignore patterns from the .gitignore file.
+        Loads ignore patterns from the given content or from the .gitignore file.
+
+        Args:
+            content (str or bytes, optional): In-memory contents of the .gitignore file.
 
         Returns:
             List[str]: A list of ignore patterns.
         """
+        if content is not None:
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            return self._parse_patterns(content.splitlines())
+
         if not self.gitignore_path.exists():
             return []
 
         with self.gitignore_path.open("r") as f:
-            return [
-                line.strip()
-                for line in f
-                if line.strip() and not line.strip().startswith("#")
-            ]
+            return self._parse_patterns(f)
+
+    @staticmethod
+    def _parse_patterns(lines):
+        """
+        Extracts ignore patterns from .gitignore lines, skipping blanks and comments.
+
+        Args:
+            lines (Iterable[str]): Lines of a .gitignore file.
+
+        Returns:
+            List[str]: A list of ignore patterns.
+        """
+        return [
+            line.strip()
+            for line in lines
+            if line.strip() and not line.strip().startswith("#")
+        ]
 
     def _matches_pattern(self, rel_path):
         """
@@ -0,0 +1,192 @@
+import os
+import threading
+from .cache_handler import CacheHandler
+
+
+class ListingCacheHandler(CacheHandler):
+    """
+    Persistent cache of directory listings of a single Dataform workspace.
+
+    Listings are stored together with the workspace state they were crawled at
+    (see `PullHandler.get_workspace_state`). A cached listing is only used when the
+    current workspace state matches the stored one, and individual directories are
+    dropped from the cache whenever the CLI itself writes or removes a path in them.
+
+    Paths written or removed by the CLI are remembered, so that before saving, changes
+    made by the CLI can be told apart from changes made by anyone else during the run
+    (see `is_consistent`).
+    """
+
+    namespace = "listings"
+
+    def __init__(self, workspace_path, cache_dir=None):
+        """
+        Initializes an empty listing cache for the given workspace.
+
+        Args:
+            workspace_path (str): Fully qualified workspace path.
+            cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        """
+        super().__init__(key=workspace_path, cache_dir=cache_dir)
+        self.workspace_path = workspace_path
+        self.listings = {}
+        self.recorded_paths = set()
+        self.cleared = False
+        self._lock = threading.Lock()
+
+    def load(self, state):
+        """
+        Loads cached listings if they were stored for the given workspace state.
+
+        Args:
+            state (dict): Current workspace state.
+
+        Returns:
+            bool: True if the cached listings are valid and were loaded, False otherwise.
+        """
+        data = self._read()
+
+        with self._lock:
+            if data is None or data.get("state") != state:
+                self.listings = {}
+                return False
+
+            self.listings = data.get("listings", {})
+            return True
+
+    def save(self, state):
+        """
+        Persists the current listings for the given workspace state.
+
+        Args:
+            state (dict): Workspace state the listings correspond to.
+        """
+        with self._lock:
+            listings = dict(self.listings)
+
+        self._write({"state": state, "listings": listings})
+
+    def get(self, path=None):
+        """
+        Returns the cached entries of a directory.
+
+        Args:
+            path (str, optional): Directory path relative to workspace root. None means root.
+
+        Returns:
+            List[dict] or None: Entries in the form {"file": ...} or {"directory": ...},
+                or None if the directory is not cached.
+        """
+        with self._lock:
+            return self.listings.get(path or "")
+
+    def set(self, path, entries):
+        """
+        Stores the entries of a directory.
+
+        Args:
+            path (str): Directory path relative to workspace root. None means root.
+            entries (List[dict]): Entries in the form {"file": ...} or {"directory": ...}.
+        """
+        with self._lock:
+            self.listings[path or ""] = entries
+
+    def record_write(self, file_path):
+        """
+        Updates the cache after a file has been written to the workspace.
+
+        Overwriting a file which is already listed does not change any listing.
+        Writing a new file may create its parent directories, so every ancestor
+        listing is dropped in that case.
+
+        Args:
+            file_path (str): Relative path of the written file.
+        """
+        parent = os.path.dirname(file_path)
+
+        with self._lock:
+            self.recorded_paths.add(file_path)
+
+            entries = self.listings.get(parent)
+            if entries is not None and {"file": file_path} in entries:
+                return
+
+            while True:
+                self.listings.pop(parent, None)
+                if not parent:
+                    break
+                parent = os.path.dirname(parent)
+
+    def record_removal(self, path):
+        """
+        Updates the cache after a file or directory has been removed from the workspace.
+
+        Args:
+            path (str): Relative path of the removed file or directory.
+        """
+        prefix = f"{path}/"
+
+        with self._lock:
+            self.recorded_paths.add(path)
+            self.listings.pop(os.path.dirname(path), None)
+            for cached_path in list(self.listings):
+                if cached_path == path or cached_path.startswith(prefix):
+                    del self.listings[cached_path]
+
+    def clear(self):
+        """
+        Drops all cached listings, both in memory and on disk.
+        """
+        with self._lock:
+            self.listings = {}
+            self.cleared = True
+
+        self._delete()
+
+    def is_recorded(self, path):
+        """
+        Determines whether a path was written or removed by the CLI, directly or within a removed directory.
+
+        Args:
+            path (str): Relative path in the workspace.
+
+        Returns:
+            bool: True if the path is accounted for by recorded writes and removals, False otherwise.
+        """
+        with self._lock:
+            return any(
+                path == recorded_path or path.startswith(f"{recorded_path}/")
+                for recorded_path in self.recorded_paths
+            )
+
+    def is_consistent(self, initial_state, current_state):
+        """
+        Determines whether all workspace changes between two states were made by the CLI itself.
+
+        The commits must be unchanged and every difference in uncommitted file changes must
+        concern a recorded path. If the cache was cleared in the meantime (e.g. after the
+        workspace changes were discarded), uncommitted changes are allowed to disappear.
+
+        Args:
+            initial_state (dict): Workspace state the listings were loaded or crawled at.
+            current_state (dict): Current workspace state.
+
+        Returns:
+            bool: True if the listings still describe the workspace, False otherwise.
+        """
+        for key in ("head_commit", "commits_ahead", "commits_behind"):
+            if initial_state[key] != current_state[key]:
+                return False
+
+        initial_changes = dict(initial_state["uncommitted_file_changes"])
+        current_changes = dict(current_state["uncommitted_file_changes"])
+
+        for path in initial_changes.keys() | current_changes.keys():
+            if initial_changes.get(path) == current_changes.get(path):
+                continue
+            if self.cleared and path not in current_changes:
+                continue
+            if not self.is_recorded(path):
+                return False
+
+        return True
@@ -0,0 +1,114 @@
+import fnmatch
+import os
+
+
+class PathFilterHandler:
+    """
+    A class to limit synchronization to a part of the repository.
+
+    The selection is defined by:
+    - Subtree roots (e.g. 'definitions/marts'), which limit where directories are crawled
+    - Include glob patterns, of which a file path has to match at least one
+    - Exclude glob patterns, of which a file path must not match any
+
+    Glob patterns are matched against paths relative to the repository root using fnmatch,
+    so '*' also matches across directory separators (e.g. 'definitions/*.sqlx').
+    """
+
+    def __init__(self, paths=None, include=None, exclude=None):
+        """
+        Initializes the PathFilterHandler.
+
+        Args:
+            paths (List[str], optional): Subtree roots relative to the repository root. Defaults to the whole repository.
+            include (List[str], optional): Glob patterns of files to include. Defaults to all files.
+            exclude (List[str], optional): Glob patterns of files to exclude. Defaults to no files.
+        """
+        self.paths = self._normalize_paths(paths or [])
+        self.include = list(include or [])
+        self.exclude = list(exclude or [])
+
+    @staticmethod
+    def _normalize_paths(paths):
+        """
+        Normalizes subtree roots and drops those nested in another root.
+
+        Args:
+            paths (List[str]): Subtree roots relative to the repository root.
+
+        Returns:
+            List[str]: Sorted list of normalized, non-overlapping subtree roots.
+        """
+        normalized = sorted({
+            os.path.normpath(path).strip(os.sep)
+            for path in paths
+        })
+
+        # An empty root or '.' selects the whole repository
+        if any(path in ("", ".") for path in normalized):
+            return []
+
+        roots = []
+        for path in normalized:
+            if not any(path.startswith(f"{root}{os.sep}") for root in roots):
+                roots.append(path)
+
+        return roots
+
+    @property
+    def roots(self):
+        """
+        Returns the directories to start crawling from.
+
+        Returns:
+            List[str or None]: Subtree roots, or [None] for the repository root.
+        """
+        return self.paths or [None]
+
+    def is_in_scope(self, path):
+        """
+        Determines whether the given path lies within one of the subtree roots.
+
+        Args:
+            path (str): Path relative to the repository root.
+
+        Returns:
+            bool: True if the path is within the selected subtrees, False otherwise.
+        """
+        if not self.paths:
+            return True
+
+        return any(
+            path == root or path.startswith(f"{root}{os.sep}")
+            for root in self.paths
+        )
+
+    def is_selected(self, file_path):
+        """
+        Determines whether the given file is selected by subtree roots and glob patterns.
+
+        Args:
+            file_path (str): File path relative to the repository root.
+
+        Returns:
+            bool: True if the file should be synchronized, False otherwise.
+        """
+        if not self.is_in_scope(file_path):
+            return False
+
+        if self.include and not any(fnmatch.fnmatch(file_path, pattern) for pattern in self.include):
+            return False
+
+        return not any(fnmatch.fnmatch(file_path, pattern) for pattern in self.exclude)
+
+    def get_scope(self):
+        """
+        Returns a filter with the same subtree roots but without glob patterns.
+
+        Used where every file within the selected subtrees matters regardless of
+        the patterns, e.g. when deciding whether a directory is empty.
+
+        Returns:
+            PathFilterHandler: Filter limited to the subtree roots.
+        """
+        return PathFilterHandler(paths=self.paths)
@@ -32,40 +32,106 @@ class PullHandler(DataformHandler):
         return response.file_contents
 
     @classmethod
-    def get_workspace_path_content(cls, workspace_path, path=None):
+    def get_workspace_state(cls, workspace_path):
+        """
+        Fetches a cheap fingerprint of the workspace state used to validate cached listings.
+
+        The fingerprint consists of the latest repository commit, the number of commits the
+        workspace is ahead of and behind it, and the uncommitted file changes of the workspace.
+        Together they change whenever files are added or removed, whether by uncommitted edits,
+        commits in the workspace or commits pushed from elsewhere.
+
+        The latest repository commit is only available for repositories without a Git remote
+        (`fetch_repository_history` rejects the others), and the workspace HEAD itself is not
+        exposed by the API. Without it, a commit followed by a push would leave the fingerprint
+        unchanged, so no state is returned and the listing must not be cached.
+
+        Args:
+            workspace_path (str): Fully qualified workspace path.
+
+        Returns:
+            dict or None: JSON-serializable workspace state, or None if it cannot be determined.
+        """
+        try:
+            request = dataform_v1.FetchRepositoryHistoryRequest(
+                name=workspace_path.split("/workspaces/")[0],
+                page_size=1
+            )
+            response = cls.dataform_client.fetch_repository_history(request=request)
+            head_commit = next(iter(response), None)
+
+            request = dataform_v1.FetchGitAheadBehindRequest(name=workspace_path)
+            ahead_behind = cls.dataform_client.fetch_git_ahead_behind(request=request)
+        except exceptions.GoogleAPICallError:
+            return None
+
+        if head_commit is None:
+            return None
+
+        request = dataform_v1.FetchFileGitStatusesRequest(name=workspace_path)
+        response = cls.dataform_client.fetch_file_git_statuses(request=request)
+
+        return {
+            "head_commit": head_commit.commit_sha,
+            "commits_ahead": ahead_behind.commits_ahead,
+            "commits_behind": ahead_behind.commits_behind,
+            "uncommitted_file_changes": sorted(
+                [change.path, change.state.name] for change in response.uncommitted_file_changes
+            ),
+        }
+
+    @classmethod
+    def get_workspace_path_content(cls, workspace_path, path=None, listing_cache=None):
         """
         Lists files and subdirectories under a given path in the workspace.
 
         Args:
             workspace_path (str): Fully qualified workspace path.
             path (str, optional): Subdirectory path to query. If None, root directory is used.
+            listing_cache (ListingCacheHandler, optional): Cache to serve and store the listing.
 
         Returns:
             List[dataform_v1.DirectoryEntry]: Files and directories at the given path.
         """
+        if listing_cache is not None:
+            cached_entries = listing_cache.get(path)
+            if cached_entries is not None:
+                return [dataform_v1.DirectoryEntry(**entry) for entry in cached_entries]
+
         request = dataform_v1.QueryDirectoryContentsRequest(
             workspace=workspace_path,
             path=path
         )
 
         response = cls.dataform_client.query_directory_contents(request=request)
+
+        if listing_cache is not None:
+            listing_cache.set(path, [
+                {"directory": entry.directory} if entry.directory else {"file": entry.file}
+                for entry in response.directory_entries
+            ])
+
         return response.directory_entries
 
     @classmethod
-    def get_workspace_files(cls, workspace_path, gitignore_handler=None):
+    def get_workspace_files(cls, workspace_path, gitignore_handler=None, listing_cache=None, path_filter=None):
         """
         Recursively retrieves all file paths in the workspace, applying .gitignore filtering if provided.
 
         Args:
             workspace_path (str): The workspace path to start from.
             gitignore_handler (GitignoreHandler, optional): Handler to filter out ignored paths.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to crawl from.
+            path_filter (PathFilterHandler, optional): Handler limiting the crawl to selected subtrees and files.
 
         Returns:
             List[str]: Sorted list of relative file paths in the workspace.
         """
-        files, directories = cls.get_workspace_path_structure(
+        files, directories = cls.get_workspace_roots_structure(
             workspace_path=workspace_path,
-            gitignore_handler=gitignore_handler
+            gitignore_handler=gitignore_handler,
+            listing_cache=listing_cache,
+            path_filter=path_filter
         )
 
         # Recursively walk through discovered directories
@@ -74,27 +140,34 @@ class PullHandler(DataformHandler):
                 sub_files, sub_dirs = cls.get_workspace_path_structure(
                     workspace_path=workspace_path,
                     path=directory,
-                    gitignore_handler=gitignore_handler
+                    gitignore_handler=gitignore_handler,
+                    listing_cache=listing_cache
                 )
 
                 files.extend(sub_files)
                 directories.extend(sub_dirs)
                 directories.remove(directory)
 
+        if path_filter:
+            files = [file_path for file_path in files if path_filter.is_selected(file_path)]
+
         return sorted(files)
 
     @staticmethod
-    def get_empty_directories(empty_dirs, files):
+    def get_empty_directories(empty_dirs, files, roots=None):
         """
         Returns the highest-level empty directories from the provided list of empty_dirs,
         excluding those that have any files within them or their subdirectories.
 
         For each empty directory, it checks each level of its path from root
         and includes the first level that does not contain any file paths.
+        When subtree roots are given, levels above the root containing the directory
+        are not checked, since files outside of the roots are not known.
 
         Args:
             empty_dirs (List[str]): List of directories known to be empty (may contain subdirs).
             files (List[str]): List of full file paths present in the system.
+            roots (List[str], optional): Subtree roots the files were collected from. Defaults to the whole repository.
 
         Returns:
             List[str]: List of top-level empty directories that do not contain any files.
@@ -106,8 +179,15 @@ class PullHandler(DataformHandler):
             norm_dir = os.path.normpath(empty_dir)
             level = norm_dir.count(os.sep)
 
+            # Start at the level of the subtree root containing this directory
+            start_level = 0
+            for root in roots or []:
+                if norm_dir == root or norm_dir.startswith(f"{root}{os.sep}"):
+                    start_level = root.count(os.sep)
+                    break
+
             # Walk from root to this directory level
-            for l in range(level + 1):
+            for l in range(start_level, level + 1):
                 # Rebuild the sub-path for current level
                 subfolder = os.sep.join(norm_dir.split(os.sep)[:l + 1])
                 is_in_files_path = False
@@ -127,13 +207,15 @@ class PullHandler(DataformHandler):
 
 
     @classmethod
-    def get_workspace_directories(cls, workspace_path, gitignore_handler=None):
+    def get_workspace_directories(cls, workspace_path, gitignore_handler=None, listing_cache=None, path_filter=None):
         """
         Retrieves all subdirectories in the workspace, optionally applying .gitignore filtering.
 
         Args:
             workspace_path (str): The workspace path to start from.
             gitignore_handler (GitignoreHandler, optional): Handler to filter out ignored paths.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to crawl from.
+            path_filter (PathFilterHandler, optional): Handler limiting the crawl to selected subtrees.
 
         Returns:
             List[dict]: Sorted list of directories in the workspace with flag indicating if the directory has any content
@@ -142,9 +224,11 @@ class PullHandler(DataformHandler):
         empty_dirs = []
         nonempty_dirs = []
 
-        files, directories = cls.get_workspace_path_structure(
+        files, directories = cls.get_workspace_roots_structure(
             workspace_path=workspace_path,
-            gitignore_handler=gitignore_handler
+            gitignore_handler=gitignore_handler,
+            listing_cache=listing_cache,
+            path_filter=path_filter
         )
 
         while directories:
@@ -154,7 +238,8 @@ class PullHandler(DataformHandler):
                 sub_files, sub_dirs = cls.get_workspace_path_structure(
                     workspace_path=workspace_path,
                     path=directory,
-                    gitignore_handler=gitignore_handler
+                    gitignore_handler=gitignore_handler,
+                    listing_cache=listing_cache
                 )
 
                 directories.remove(directory)
@@ -167,9 +252,55 @@ class PullHandler(DataformHandler):
 
         return sorted(empty_dirs), sorted(nonempty_dirs)
 
+    @classmethod
+    def get_workspace_roots_structure(cls, workspace_path, gitignore_handler=None, listing_cache=None, path_filter=None):
+        """
+        Retrieves immediate files and subdirectories of every subtree root selected by the path filter.
+
+        Subtree roots which do not exist in the workspace are skipped.
+
+        Args:
+            workspace_path (str): The workspace path.
+            gitignore_handler (GitignoreHandler, optional): Handler to check for ignored files/directories.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to read from.
+            path_filter (PathFilterHandler, optional): Handler defining the subtree roots. Defaults to the workspace root.
+
+        Returns:
+            Tuple[List[str], List[str]]: A tuple of two lists:
+                - files (List[str]): Paths to files.
+                - directories (List[str]): Paths to subdirectories.
+        """
+        if not path_filter:
+            return cls.get_workspace_path_structure(
+                workspace_path=workspace_path,
+                gitignore_handler=gitignore_handler,
+                listing_cache=listing_cache
+            )
+
+        files = []
+        directories = []
+
+        for root in path_filter.roots:
+            try:
+                root_files, root_dirs = cls.get_workspace_path_structure(
+                    workspace_path=workspace_path,
+                    path=root,
+                    gitignore_handler=gitignore_handler,
+                    listing_cache=listing_cache
+                )
+            except exceptions.NotFound:
+                if root is None:
+                    raise
+                continue
+
+            files.extend(root_files)
+            directories.extend(root_dirs)
+
+        return files, directories
+
 
     @classmethod
-    def get_workspace_path_structure(cls, workspace_path, path=None, gitignore_handler=None):
+    def get_workspace_path_structure(cls, workspace_path, path=None, gitignore_handler=None, listing_cache=None):
         """
         Retrieves immediate files and subdirectories at a given path in the workspace, with optional filtering.
 
@@ -177,6 +308,7 @@ class PullHandler(DataformHandler):
             workspace_path (str): The workspace path.
             path (str, optional): Relative path from workspace root to inspect. Defaults to root.
             gitignore_handler (GitignoreHandler, optional): Handler to check for ignored files/directories.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to read from.
 
         Returns:
             Tuple[List[str], List[str]]: A tuple of two lists:
@@ -188,7 +320,8 @@ class PullHandler(DataformHandler):
 
         entries = cls.get_workspace_path_content(
             workspace_path=workspace_path,
-            path=path
+            path=path,
+            listing_cache=listing_cache
         )
 
         for entry in entries:
@@ -11,33 +11,42 @@ class PushHandler(DataformHandler):
     """
 
     @classmethod
-    def get_local_files(cls, source_dir):
+    def get_local_files(cls, source_dir, path_filter=None):
         """
         Recursively collects all files in the given local source directory.
 
         Args:
             source_dir (str): Path to the local directory to search.
+            path_filter (PathFilterHandler, optional): Handler limiting the scan to selected subtrees and files.
 
         Returns:
             List[str]: Sorted list of file paths relative to source_dir.
         """
         local_files = []
 
+        scan_dirs = [source_dir]
+        if path_filter:
+            scan_dirs = [os.path.join(source_dir, root or "") for root in path_filter.roots]
+
         # Walk the directory tree and collect full paths
-        for root, _, files in os.walk(source_dir):
-            for file_ in files:
-                local_file_path = os.path.join(root, file_)
-                local_files.append(local_file_path)
+        for scan_dir in scan_dirs:
+            for root, _, files in os.walk(scan_dir):
+                for file_ in files:
+                    local_file_path = os.path.join(root, file_)
+                    local_files.append(local_file_path)
 
         # Convert full paths to relative paths by removing the source_dir prefix
         local_files = [
             file_.replace(f"{source_dir}/", "") for file_ in local_files
         ]
 
+        if path_filter:
+            local_files = [file_ for file_ in local_files if path_filter.is_selected(file_)]
+
         return sorted(local_files)
 
     @classmethod
-    def write_file(cls, source_file, target_location, workspace_path):
+    def write_file(cls, source_file, target_location, workspace_path, listing_cache=None):
         """
         Uploads a local file to the specified location in a Dataform workspace.
 
@@ -45,6 +54,7 @@ class PushHandler(DataformHandler):
             source_file (str): Local file path to read from.
             target_location (str): Relative target path in the workspace.
             workspace_path (str): Fully qualified workspace path.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
 
         Returns:
             None
@@ -52,6 +62,22 @@ class PushHandler(DataformHandler):
         with open(source_file, "rb") as f:
             file_contents = f.read()
 
+        cls.write_file_contents(file_contents, target_location, workspace_path, listing_cache=listing_cache)
+
+    @classmethod
+    def write_file_contents(cls, file_contents, target_location, workspace_path, listing_cache=None):
+        """
+        Uploads in-memory content to the specified location in a Dataform workspace.
+
+        Args:
+            file_contents (bytes): The raw content to write.
+            target_location (str): Relative target path in the workspace.
+            workspace_path (str): Fully qualified workspace path.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
+
+        Returns:
+            None
+        """
         request = dataform_v1.WriteFileRequest(
             workspace=workspace_path,
             path=target_location,
@@ -60,14 +86,18 @@ class PushHandler(DataformHandler):
 
         response = cls.dataform_client.write_file(request=request)
 
+        if listing_cache is not None:
+            listing_cache.record_write(target_location)
+
     @classmethod
-    def remove_file(cls, file_path, workspace_path):
+    def remove_file(cls, file_path, workspace_path, listing_cache=None):
         """
         Removes a file from the remote Dataform workspace.
 
         Args:
             file_path (str): Relative path of the file to remove.
             workspace_path (str): Fully qualified workspace path.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
 
         Returns:
             None
@@ -79,14 +109,18 @@ class PushHandler(DataformHandler):
 
         response = cls.dataform_client.remove_file(request=request)
 
+        if listing_cache is not None:
+            listing_cache.record_removal(file_path)
+
     @classmethod
-    def remove_directory(cls, dir_path, workspace_path):
+    def remove_directory(cls, dir_path, workspace_path, listing_cache=None):
         """
         Removes a directory from the remote Dataform workspace.
 
         Args:
             dir_path (str): Relative path of the directory to remove.
             workspace_path (str): Fully qualified workspace path.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
 
         Returns:
             None
@@ -98,6 +132,32 @@ class PushHandler(DataformHandler):
 
         response = cls.dataform_client.remove_directory(request=request)
 
+        if listing_cache is not None:
+            listing_cache.record_removal(dir_path)
+
+    @classmethod
+    def reset_workspace_changes(cls, workspace_path, clean=True, listing_cache=None):
+        """
+        Discards all uncommitted changes in a Dataform workspace.
+
+        Args:
+            workspace_path (str): Fully qualified workspace path.
+            clean (bool): If True, untracked files are removed as well. Defaults to True.
+            listing_cache (ListingCacheHandler, optional): Cache of directory listings to drop.
+
+        Returns:
+            None
+        """
+        request = dataform_v1.ResetWorkspaceChangesRequest(
+            name=workspace_path,
+            clean=clean
+        )
+
+        response = cls.dataform_client.reset_workspace_changes(request=request)
+
+        if listing_cache is not None:
+            listing_cache.clear()
+
     @classmethod
     def commit_workspace_changes(cls, workspace_path, message=None):
         """
@@ -0,0 +1,71 @@
+import hashlib
+
+
+class ShardHandler:
+    """
+    A class to deterministically split a list of files between several workers.
+
+    Each file is assigned to a shard by a stable hash of its relative path, so every
+    worker computes the same assignment independently of file order, platform or
+    Python hash randomization.
+    """
+
+    def __init__(self, index, count):
+        """
+        Initializes the ShardHandler.
+
+        Args:
+            index (int): 1-based index of the shard handled by this worker.
+            count (int): Total number of shards.
+        """
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}, expected 1 <= index <= count")
+
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def from_spec(cls, spec):
+        """
+        Creates a ShardHandler from a specification in the form 'i/N' (e.g. '2/4').
+
+        Args:
+            spec (str): Shard specification with a 1-based shard index.
+
+        Returns:
+            ShardHandler: The shard handler.
+        """
+        try:
+            index, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid shard '{spec}', expected the form i/N (e.g. 2/4)") from None
+
+        return cls(index, count)
+
+    def __str__(self):
+        return f"{self.index}/{self.count}"
+
+    def is_selected(self, file_path):
+        """
+        Determines whether the given file belongs to this shard.
+
+        Args:
+            file_path (str): File path relative to the repository root.
+
+        Returns:
+            bool: True if the file is assigned to this shard, False otherwise.
+        """
+        digest = hashlib.sha1(file_path.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count == self.index - 1
+
+    def select(self, file_paths):
+        """
+        Filters the files assigned to this shard.
+
+        Args:
+            file_paths (List[str]): File paths relative to the repository root.
+
+        Returns:
+            List[str]: File paths assigned to this shard, in the original order.
+        """
+        return [file_path for file_path in file_paths if self.is_selected(file_path)]
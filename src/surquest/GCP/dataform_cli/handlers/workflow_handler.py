@@ -0,0 +1,145 @@
+from google.cloud import dataform_v1
+from google.api_core import exceptions
+from google.api_core import retry
+from .dataform_handler import DataformHandler
+
+# Retries polling requests on transient errors with exponential backoff (1s, 2s, 4s, ... up to 30s).
+# Creating invocations is not retried, as a retried request could start the same invocation twice.
+POLLING_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(
+        exceptions.ServiceUnavailable,
+        exceptions.DeadlineExceeded,
+        exceptions.TooManyRequests,
+        exceptions.InternalServerError,
+    ),
+    initial=1.0,
+    maximum=30.0,
+    multiplier=2.0,
+    timeout=120.0,
+)
+
+
+class WorkflowHandler(DataformHandler):
+    """
+    Handler class for starting and tracking workflow invocations in a Google Cloud Dataform repository.
+    Inherits the Dataform API client setup from DataformHandler.
+    """
+
+    TERMINAL_STATES = (
+        dataform_v1.WorkflowInvocation.State.SUCCEEDED,
+        dataform_v1.WorkflowInvocation.State.CANCELLED,
+        dataform_v1.WorkflowInvocation.State.FAILED,
+    )
+
+    @staticmethod
+    def parse_target(target):
+        """
+        Parses an action target given as 'name', 'schema.name' or 'database.schema.name'.
+
+        Args:
+            target (str): Dot-separated action target.
+
+        Returns:
+            dataform_v1.Target: The parsed target.
+        """
+        parts = target.split(".")
+        if len(parts) > 3:
+            raise ValueError(f"Invalid target '{target}', expected [[database.]schema.]name")
+
+        database, schema, name = [""] * (3 - len(parts)) + parts
+        return dataform_v1.Target(database=database, schema=schema, name=name)
+
+    @staticmethod
+    def format_target(target):
+        """
+        Formats an action target as a dot-separated string.
+
+        Args:
+            target (dataform_v1.Target): The action target.
+
+        Returns:
+            str: The target in the form 'database.schema.name', omitting empty parts.
+        """
+        return ".".join(part for part in (target.database, target.schema, target.name) if part)
+
+    @staticmethod
+    def build_invocation_config(
+            tags=None,
+            targets=None,
+            include_dependencies=False,
+            include_dependents=False,
+            full_refresh=False
+        ):
+        """
+        Builds the configuration selecting which actions a workflow invocation runs.
+
+        Args:
+            tags (List[str], optional): Tags of actions to run.
+            targets (List[str], optional): Targets of actions to run, see `parse_target`.
+            include_dependencies (bool): If True, also runs transitive dependencies of selected actions.
+            include_dependents (bool): If True, also runs transitive dependents of selected actions.
+            full_refresh (bool): If True, incremental tables are fully refreshed.
+
+        Returns:
+            dataform_v1.InvocationConfig: The invocation configuration.
+        """
+        return dataform_v1.InvocationConfig(
+            included_tags=tags or [],
+            included_targets=[WorkflowHandler.parse_target(target) for target in targets or []],
+            transitive_dependencies_included=include_dependencies,
+            transitive_dependents_included=include_dependents,
+            fully_refresh_incremental_tables_enabled=full_refresh,
+        )
+
+    @classmethod
+    def create_workflow_invocation(cls, repository_path, compilation_result_name, invocation_config):
+        """
+        Starts a workflow invocation of a compilation result.
+
+        Args:
+            repository_path (str): Fully qualified repository path.
+            compilation_result_name (str): Fully qualified compilation result name.
+            invocation_config (dataform_v1.InvocationConfig): Configuration selecting actions to run.
+
+        Returns:
+            dataform_v1.WorkflowInvocation: The created workflow invocation.
+        """
+        request = dataform_v1.CreateWorkflowInvocationRequest(
+            parent=repository_path,
+            workflow_invocation=dataform_v1.WorkflowInvocation(
+                compilation_result=compilation_result_name,
+                invocation_config=invocation_config,
+            )
+        )
+
+        return cls.dataform_client.create_workflow_invocation(request=request)
+
+    @classmethod
+    def get_workflow_invocation(cls, name):
+        """
+        Fetches the current state of a workflow invocation.
+
+        Args:
+            name (str): Fully qualified workflow invocation name.
+
+        Returns:
+            dataform_v1.WorkflowInvocation: The workflow invocation.
+        """
+        request = dataform_v1.GetWorkflowInvocationRequest(name=name)
+
+        return cls.dataform_client.get_workflow_invocation(request=request, retry=POLLING_RETRY)
+
+    @classmethod
+    def get_workflow_invocation_actions(cls, name):
+        """
+        Fetches the current state of all actions of a workflow invocation.
+
+        Args:
+            name (str): Fully qualified workflow invocation name.
+
+        Returns:
+            List[dataform_v1.WorkflowInvocationAction]: Actions of the workflow invocation.
+        """
+        request = dataform_v1.QueryWorkflowInvocationActionsRequest(name=name)
+
+        return list(cls.dataform_client.query_workflow_invocation_actions(request=request, retry=POLLING_RETRY))
@@ -0,0 +1,152 @@
+import cProfile
+import io
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from .logger import get_fixed_width_logger
+
+PROFILERS = ("cprofile", "tracemalloc")
+
+DEFAULT_OUTPUT_PATHS = {
+    "cprofile": "dataform-cli.prof",
+    "tracemalloc": "dataform-cli.tracemalloc",
+}
+
+# How often traced memory is sampled, and how much it has to grow over the last snapshot to take a new one
+PEAK_SAMPLING_INTERVAL = 0.1
+PEAK_SNAPSHOT_GROWTH = 1.1
+
+
+@contextmanager
+def profile(profiler="cprofile", output_path=None, top=20, logger=get_fixed_width_logger(name="profileLogger")):
+    """
+    Profiles the wrapped block and reports the results once it finishes (even if it fails).
+
+    Supported profilers:
+    - 'cprofile': Collects CPU statistics, dumps them as a pstats file readable by
+      `python -m pstats` or snakeviz, and logs the top functions by cumulative time.
+      Only the calling thread is profiled, so work done by reader and writer threads
+      (e.g. in `clone`) shows up as time spent waiting for them.
+    - 'tracemalloc': Traces memory allocations of all threads and takes a snapshot
+      whenever traced memory reaches a new peak. Dumps the peak snapshot readable by
+      `tracemalloc.Snapshot.load`, and logs the peak traced memory together with
+      the top allocation sites at the peak.
+
+    Args:
+        profiler (str): Name of the profiler, one of PROFILERS. Defaults to 'cprofile'.
+        output_path (str, optional): Path of the output file. Defaults to DEFAULT_OUTPUT_PATHS[profiler].
+        top (int): Number of entries in the logged summary, must be positive. Defaults to 20.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
+    if profiler not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{profiler}', expected one of: {', '.join(PROFILERS)}")
+    if top < 1:
+        raise ValueError(f"Number of summary entries must be positive, got {top}")
+
+    output_path = output_path or DEFAULT_OUTPUT_PATHS[profiler]
+
+    if profiler == "cprofile":
+        profiler_ = cProfile.Profile()
+        profiler_.enable()
+        try:
+            yield
+        finally:
+            profiler_.disable()
+            _report_cprofile(profiler_, output_path, top, logger)
+
+    else:
+        tracemalloc.start(25)
+        peak_tracker = _PeakSnapshotTracker()
+        peak_tracker.start()
+        try:
+            yield
+        finally:
+            peak_tracker.stop()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            _report_tracemalloc(peak_tracker.snapshot, peak_tracker.snapshot_size, peak, output_path, top, logger)
+
+
+class _PeakSnapshotTracker(threading.Thread):
+    """
+    Background thread sampling traced memory and keeping a snapshot taken close to its peak.
+
+    A new snapshot is taken when traced memory grows by PEAK_SNAPSHOT_GROWTH over the size
+    at the last snapshot, which limits the number of (expensive) snapshots to a few per
+    doubling of memory usage.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.snapshot = None
+        self.snapshot_size = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(PEAK_SAMPLING_INTERVAL):
+            self._sample()
+
+    def _sample(self):
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.snapshot_size * PEAK_SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        """
+        Stops sampling and takes a final sample, so short runs get a snapshot as well.
+        """
+        self._stopped.set()
+        self.join()
+        self._sample()
+
+
+def _report_cprofile(profiler_, output_path, top, logger):
+    """
+    Dumps cProfile statistics and logs the top functions by cumulative time.
+
+    Args:
+        profiler_ (cProfile.Profile): Disabled profiler with collected statistics.
+        output_path (str): Path of the pstats output file.
+        top (int): Number of functions in the logged summary.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
+    profiler_.dump_stats(output_path)
+    logger.info(f"Profile statistics written to: {output_path}")
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler_, stream=summary)
+    stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    logger.info(f"Top {top} functions by cumulative time:")
+    for line in summary.getvalue().splitlines():
+        if line.strip():
+            logger.info(line)
+
+
+def _report_tracemalloc(snapshot, snapshot_size, peak, output_path, top, logger):
+    """
+    Dumps the peak tracemalloc snapshot and logs the peak memory and the top allocation sites at the peak.
+
+    Args:
+        snapshot (tracemalloc.Snapshot): Snapshot taken closest to the peak of traced memory.
+        snapshot_size (int): Size of traced memory blocks in bytes when the snapshot was taken.
+        peak (int): Peak size of traced memory blocks in bytes.
+        output_path (str): Path of the snapshot output file.
+        top (int): Number of allocation sites in the logged summary.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
+    snapshot.dump(output_path)
+    logger.info(f"Memory snapshot written to: {output_path}")
+    logger.info(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB")
+
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+
+    logger.info(f"Top {top} allocation sites by size at {snapshot_size / 1024 / 1024:.1f} MiB traced memory:")
+    for stat in snapshot.statistics("lineno")[:top]:
+        logger.info(str(stat))
@@ -1,11 +1,26 @@
 import os
 from google.api_core import exceptions
 from .handlers.gitignore_handler import GitignoreHandler
+from .handlers.listing_cache_handler import ListingCacheHandler
+from .handlers.path_filter_handler import PathFilterHandler
 from .handlers.pull_handler import PullHandler
 from .logger import get_fixed_width_logger
 
 
-def pull(project_id, region, repository_id, workspace_id, target_dir, logger=get_fixed_width_logger(name="pullLogger")):
+def pull(
+        project_id,
+        region,
+        repository_id,
+        workspace_id,
+        target_dir,
+        use_listing_cache=True,
+        cache_dir=None,
+        paths=None,
+        include=None,
+        exclude=None,
+        shard=None,
+        logger=get_fixed_width_logger(name="pullLogger")
+    ):
     """
     Downloads all files from a Google Cloud Dataform workspace to a local directory,
     excluding files and directories specified in a `.gitignore` file if present in the workspace.
@@ -19,6 +34,15 @@ def pull(project_id, region, repository_id, workspace_id, target_dir, logger=get
         repository_id (str): The ID of the Dataform repository.
         workspace_id (str): The ID of the Dataform workspace.
         target_dir (str): The path to the local directory where files will be saved.
+        use_listing_cache (bool): If True, remote directory listings are cached on disk and reused
+            while the workspace state is unchanged. Defaults to True.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        paths (List[str], optional): Subtrees to download, relative to the repository root.
+            The remote crawl starts at them. Defaults to the whole repository.
+        include (List[str], optional): Glob patterns of files to download. Defaults to all files.
+        exclude (List[str], optional): Glob patterns of files not to download. Defaults to no files.
+        shard (ShardHandler, optional): Shard of the files to download, for splitting a pull
+            across several workers. Defaults to no sharding.
         logger (logging.Logger): Logger instance for structured logging. Defaults to fixed-width logger.
     """
     workspace_path = PullHandler.dataform_client.workspace_path(
@@ -55,14 +79,28 @@ def pull(project_id, region, repository_id, workspace_id, target_dir, logger=get
     except exceptions.NotFound:
         logger.warning("No .gitignore file found in workspace. Proceeding without ignore rules.")
 
+    listing_cache = None
+    if use_listing_cache:
+        listing_cache, workspace_state = open_listing_cache(workspace_path, cache_dir, logger)
+
     # List and optionally filter workspace files
     workspace_files = PullHandler.get_workspace_files(
         workspace_path=workspace_path,
-        gitignore_handler=gitignore_handler
+        gitignore_handler=gitignore_handler,
+        listing_cache=listing_cache,
+        path_filter=PathFilterHandler(paths=paths, include=include, exclude=exclude)
     )
 
+    # Pulling does not modify the workspace, so the state fetched above is still current
+    if listing_cache is not None:
+        listing_cache.save(workspace_state)
+
     logger.info(f"Found {len(workspace_files)} files in workspace")
 
+    if shard:
+        workspace_files = shard.select(workspace_files)
+        logger.info(f"Shard {shard}: {len(workspace_files)} files to pull")
+
     for file_path in workspace_files:
         logger.info(f"Pulling: {file_path}")
         try:
@@ -85,3 +123,96 @@ def pull(project_id, region, repository_id, workspace_id, target_dir, logger=get
             logger.error(f"Failed to pull {file_path}: {e}")
 
     logger.info("Pull completed successfully.")
+
+
+def open_listing_cache(workspace_path, cache_dir, logger):
+    """
+    Creates a listing cache for the workspace and loads it if it matches the current workspace state.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        logger (logging.Logger): Logger instance for structured logging.
+
+    Returns:
+        Tuple[ListingCacheHandler, dict]: The listing cache and the current workspace state,
+            or (None, None) if the workspace state could not be determined.
+    """
+    try:
+        workspace_state = PullHandler.get_workspace_state(workspace_path)
+    except exceptions.GoogleAPICallError as e:
+        logger.warning(f"Failed to fetch workspace state, listing cache disabled: {e}")
+        return None, None
+
+    if workspace_state is None:
+        logger.info("Workspace state cannot be tracked (e.g. repository connected to Git), listing cache disabled")
+        return None, None
+
+    listing_cache = ListingCacheHandler(workspace_path, cache_dir=cache_dir)
+    if listing_cache.load(workspace_state):
+        logger.info("Workspace unchanged since last run, using cached remote listing")
+    else:
+        logger.debug("Workspace changed since last run, remote listing will be crawled")
+
+    return listing_cache, workspace_state
+
+
+def check_listing_cache(listing_cache, workspace_path, workspace_state, logger):
+    """
+    Checks that the workspace only changed through the CLI since the listings were loaded or crawled.
+
+    Listings crawled before someone else edited the workspace (e.g. in the UI during a long push)
+    would otherwise be saved under a state which already includes that edit. If any change is not
+    accounted for, the listing cache is cleared.
+
+    Args:
+        listing_cache (ListingCacheHandler): The listing cache to check.
+        workspace_path (str): Fully qualified workspace path.
+        workspace_state (dict): Workspace state the listings were loaded or crawled at.
+        logger (logging.Logger): Logger instance for structured logging.
+
+    Returns:
+        dict or None: The current workspace state, or None if the listing cache was cleared.
+    """
+    try:
+        current_state = PullHandler.get_workspace_state(workspace_path)
+    except exceptions.GoogleAPICallError as e:
+        logger.warning(f"Failed to fetch workspace state, listing cache not saved: {e}")
+        current_state = None
+
+    if current_state is None or not listing_cache.is_consistent(workspace_state, current_state):
+        logger.info("Workspace changed outside of this run, listing cache dropped")
+        listing_cache.clear()
+        return None
+
+    return current_state
+
+
+def save_listing_cache(listing_cache, workspace_path, expected_state, logger):
+    """
+    Persists the listing cache for the current workspace state, provided it is the expected one.
+
+    Only the uncommitted file changes and the number of commits behind are compared, as committing
+    and pushing change the commits without changing any files.
+
+    Args:
+        listing_cache (ListingCacheHandler): The listing cache to persist.
+        workspace_path (str): Fully qualified workspace path.
+        expected_state (dict): Workspace state checked by `check_listing_cache`, with the
+            uncommitted file changes expected after committing.
+        logger (logging.Logger): Logger instance for structured logging.
+    """
+    try:
+        workspace_state = PullHandler.get_workspace_state(workspace_path)
+    except exceptions.GoogleAPICallError as e:
+        logger.warning(f"Failed to fetch workspace state, listing cache not saved: {e}")
+        workspace_state = None
+
+    if workspace_state is None or any(
+        workspace_state[key] != expected_state[key]
+        for key in ("uncommitted_file_changes", "commits_behind")
+    ):
+        listing_cache.clear()
+        return
+
+    listing_cache.save(workspace_state)
@@ -1,9 +1,11 @@
 import os
 from google.api_core import exceptions
 from .handlers.gitignore_handler import GitignoreHandler
+from .handlers.path_filter_handler import PathFilterHandler
 from .handlers.pull_handler import PullHandler
 from .handlers.push_handler import PushHandler
 from .logger import get_fixed_width_logger
+from .pull import open_listing_cache, check_listing_cache, save_listing_cache
 
 
 def push(
@@ -15,6 +17,13 @@ def push(
         delete_remote_files=True,
         autocommit=True,
         autopush=True,
+        use_listing_cache=True,
+        cache_dir=None,
+        paths=None,
+        include=None,
+        exclude=None,
+        shard=None,
+        mirror=False,
         logger=get_fixed_width_logger(name="pushLogger")
     ):
     """
@@ -35,69 +44,395 @@ def push(
             that are not present in the local source directory. Defaults to True.
         autocommit (bool): If True, automatically commits the changes after pushing. Defaults to True.
         autopush (bool): If True, automatically pushes the committed changes to the remote repository. Defaults to True.
+        use_listing_cache (bool): If True, remote directory listings are cached on disk and reused
+            while the workspace state is unchanged. Defaults to True.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        paths (List[str], optional): Subtrees to synchronize, relative to the repository root.
+            Local scan, remote crawl and deletions are limited to them. Defaults to the whole repository.
+        include (List[str], optional): Glob patterns of files to synchronize. Defaults to all files.
+        exclude (List[str], optional): Glob patterns of files not to synchronize. Defaults to no files.
+        shard (ShardHandler, optional): Shard of the files to upload, for splitting a push
+            across several workers. Only the upload is done; deletions, cleanup, commit and push
+            are left to a single `finalize` run after all shards. Defaults to no sharding.
+        mirror (bool): If True, makes the workspace match the source directory by discarding uncommitted
+            changes and removing top-level entries (or the selected subtrees) before the upload, instead of
+            deleting stale files and empty directories one by one. Cannot be combined with `shard`,
+            `include`/`exclude` or disabled `delete_remote_files`. Defaults to False.
         logger (logging.Logger): Logger instance for structured logging. A default fixed-width logger is used if not provided.
     """
     logger.info("Determining workspace path...")
     workspace_path = PushHandler.get_workspace_path(project_id, region, repository_id, workspace_id)
 
+    path_filter = PathFilterHandler(paths=paths, include=include, exclude=exclude)
+    if path_filter.paths:
+        logger.info(f"Limiting push to: {', '.join(path_filter.paths)}")
+
+    if mirror and (shard or path_filter.include or path_filter.exclude or not delete_remote_files):
+        raise ValueError("Mirror mode cannot be combined with shard, include/exclude patterns or kept remote files")
+
+    logger.info("Scanning local files...")
+    local_files = PushHandler.get_local_files(source_dir, path_filter=path_filter)
+
+    # A shard only uploads its part of the files, the rest is left to `finalize`
+    if shard:
+        shard_files = shard.select(local_files)
+        logger.info(f"Shard {shard}: {len(shard_files)} of {len(local_files)} local files")
+
+        upload_files(shard_files, source_dir, workspace_path, logger)
+
+        logger.info("Shard push completed successfully. Run finalize once all shards are pushed.")
+        return
+
+    listing_cache, workspace_state = None, None
+    if use_listing_cache:
+        listing_cache, workspace_state = open_listing_cache(workspace_path, cache_dir, logger)
+
+    if mirror:
+        logger.info(f"Mirroring {len(local_files)} local files")
+
+        mirror_workspace(workspace_path, path_filter, logger, listing_cache=listing_cache)
+        upload_files(local_files, source_dir, workspace_path, logger, listing_cache=listing_cache)
+        commit_and_push(
+            workspace_path, autocommit, autopush, logger,
+            listing_cache=listing_cache,
+            workspace_state=workspace_state
+        )
+
+        logger.info("Push completed successfully.")
+        return
+
+    remote_files = get_remote_files(workspace_path, listing_cache, path_filter, logger)
+
+    logger.info(f"{len(local_files)} local files, {len(remote_files)} remote files")
+
+    upload_files(local_files, source_dir, workspace_path, logger, listing_cache=listing_cache)
+
+    finalize_workspace(
+        workspace_path=workspace_path,
+        local_files=local_files,
+        remote_files=remote_files,
+        delete_remote_files=delete_remote_files,
+        autocommit=autocommit,
+        autopush=autopush,
+        listing_cache=listing_cache,
+        workspace_state=workspace_state,
+        path_filter=path_filter,
+        logger=logger
+    )
+
+    logger.info("Push completed successfully.")
+
+
+def finalize(
+        project_id,
+        region,
+        repository_id,
+        workspace_id,
+        source_dir,
+        delete_remote_files=True,
+        autocommit=True,
+        autopush=True,
+        use_listing_cache=True,
+        cache_dir=None,
+        paths=None,
+        include=None,
+        exclude=None,
+        logger=get_fixed_width_logger(name="pushLogger")
+    ):
+    """
+    Completes a push split into shards (see `push` with `shard`) once all shards have uploaded their files.
+
+    Deletes remote files not present in the local source directory, removes empty directories,
+    and optionally commits and pushes the changes, exactly once for the whole sync.
+    Arguments have the same meaning as for `push` and must select the same files as the shards did.
+
+    Args:
+        project_id (str): The Google Cloud project ID where the Dataform repository resides.
+        region (str): The region in which the Dataform repository is hosted.
+        repository_id (str): The unique identifier of the Dataform repository.
+        workspace_id (str): The ID of the workspace within the repository to finalize.
+        source_dir (str): The path to the local directory whose contents were pushed.
+        delete_remote_files (bool): If True, removes files from the remote workspace
+            that are not present in the local source directory. Defaults to True.
+        autocommit (bool): If True, automatically commits the changes. Defaults to True.
+        autopush (bool): If True, automatically pushes the committed changes to the remote repository. Defaults to True.
+        use_listing_cache (bool): If True, remote directory listings are cached on disk and reused
+            while the workspace state is unchanged. Defaults to True.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        paths (List[str], optional): Subtrees which were synchronized. Defaults to the whole repository.
+        include (List[str], optional): Glob patterns of files which were synchronized. Defaults to all files.
+        exclude (List[str], optional): Glob patterns of files which were not synchronized. Defaults to no files.
+        logger (logging.Logger): Logger instance for structured logging. A default fixed-width logger is used if not provided.
+    """
+    logger.info("Determining workspace path...")
+    workspace_path = PushHandler.get_workspace_path(project_id, region, repository_id, workspace_id)
+
+    path_filter = PathFilterHandler(paths=paths, include=include, exclude=exclude)
+    if path_filter.paths:
+        logger.info(f"Limiting finalize to: {', '.join(path_filter.paths)}")
+
     logger.info("Scanning local files...")
-    local_files = PushHandler.get_local_files(source_dir)
+    local_files = PushHandler.get_local_files(source_dir, path_filter=path_filter)
+
+    listing_cache, workspace_state = None, None
+    if use_listing_cache:
+        listing_cache, workspace_state = open_listing_cache(workspace_path, cache_dir, logger)
+
+    remote_files = get_remote_files(workspace_path, listing_cache, path_filter, logger)
+
+    logger.info(f"{len(local_files)} local files, {len(remote_files)} remote files")
+
+    finalize_workspace(
+        workspace_path=workspace_path,
+        local_files=local_files,
+        remote_files=remote_files,
+        delete_remote_files=delete_remote_files,
+        autocommit=autocommit,
+        autopush=autopush,
+        listing_cache=listing_cache,
+        workspace_state=workspace_state,
+        path_filter=path_filter,
+        logger=logger
+    )
+
+    logger.info("Finalize completed successfully.")
 
+
+def get_remote_files(workspace_path, listing_cache, path_filter, logger):
+    """
+    Lists remote files selected by the path filter, excluding paths ignored by the local `.gitignore`.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to crawl from.
+        path_filter (PathFilterHandler, optional): Handler limiting the crawl to selected subtrees and files.
+        logger (logging.Logger): Logger instance for structured logging.
+
+    Returns:
+        List[str]: Relative paths of remote files, or an empty list if listing failed.
+    """
     logger.info("Retrieving remote files...")
     try:
-        remote_files = PullHandler.get_workspace_files(
+        return PullHandler.get_workspace_files(
             workspace_path=workspace_path,
-            gitignore_handler=GitignoreHandler(".gitignore")
+            gitignore_handler=GitignoreHandler(".gitignore"),
+            listing_cache=listing_cache,
+            path_filter=path_filter
         )
     except exceptions.GoogleAPICallError as e:
         logger.error(f"Failed to list remote files: {e}")
-        remote_files = []
+        return []
 
-    logger.info(f"{len(local_files)} local files, {len(remote_files)} remote files")
 
-    # Push local files
+def upload_files(local_files, source_dir, workspace_path, logger, listing_cache=None):
+    """
+    Uploads local files to the remote workspace.
+
+    Args:
+        local_files (List[str]): Paths of files to upload, relative to source_dir.
+        source_dir (str): The path to the local source directory.
+        workspace_path (str): Fully qualified workspace path.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
+    """
     for relative_path in local_files:
         local_path = os.path.join(source_dir, relative_path)
         logger.info(f"Pushing file: {relative_path}")
-        PushHandler.write_file(local_path, relative_path, workspace_path)
+        PushHandler.write_file(local_path, relative_path, workspace_path, listing_cache=listing_cache)
+
 
+def finalize_workspace(
+        workspace_path,
+        local_files,
+        remote_files,
+        delete_remote_files,
+        autocommit,
+        autopush,
+        logger,
+        listing_cache=None,
+        workspace_state=None,
+        path_filter=None
+    ):
+    """
+    Runs the steps following the upload: deletes stale files and empty directories,
+    commits and pushes changes, and persists the listing cache.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        local_files (List[str]): Relative paths of files that should remain in the workspace.
+        remote_files (List[str]): Relative paths of files present in the workspace before the upload.
+        delete_remote_files (bool): If True, removes remote files not present in local_files.
+        autocommit (bool): If True, commits the changes.
+        autopush (bool): If True, pushes the committed changes to the remote repository.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date and persist.
+        workspace_state (dict, optional): Workspace state the listing cache was opened at.
+        path_filter (PathFilterHandler, optional): Handler limiting the cleanup to selected subtrees.
+    """
     # Delete remote files not present locally
     if delete_remote_files:
-        files_to_delete = set(remote_files) - set(local_files)
-        for file_path in files_to_delete:
-            logger.info(f"Deleting remote file: {file_path}")
-            PushHandler.remove_file(file_path, workspace_path)
+        remove_stale_files(
+            remote_files=remote_files,
+            local_files=local_files,
+            workspace_path=workspace_path,
+            listing_cache=listing_cache,
+            logger=logger
+        )
+
+    remove_empty_directories(
+        workspace_path=workspace_path,
+        gitignore_handler=GitignoreHandler(gitignore_path=".gitignore"),
+        listing_cache=listing_cache,
+        path_filter=path_filter,
+        logger=logger
+    )
+
+    commit_and_push(
+        workspace_path, autocommit, autopush, logger,
+        listing_cache=listing_cache,
+        workspace_state=workspace_state
+    )
+
+
+def commit_and_push(workspace_path, autocommit, autopush, logger, listing_cache=None, workspace_state=None):
+    """
+    Commits workspace changes and pushes the commits to the linked Git repository, if enabled,
+    and persists the listing cache.
+
+    The listing cache is only persisted if every change made to the workspace since
+    `workspace_state` was made by the CLI itself, see `check_listing_cache`.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        autocommit (bool): If True, commits the changes.
+        autopush (bool): If True, pushes the committed changes to the remote repository.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to persist.
+        workspace_state (dict, optional): Workspace state the listing cache was opened at.
+    """
+    checked_state = None
+    if listing_cache is not None:
+        checked_state = check_listing_cache(listing_cache, workspace_path, workspace_state, logger)
+
+    # Commit changes if enabled
+    if autocommit:
+        logger.info("Committing workspace changes...")
+        PushHandler.commit_workspace_changes(workspace_path, message="Automated push from CLI")
+
+    # Push commits if enabled
+    if autopush:
+        logger.info("Pushing git commits...")
+        PushHandler.push_git_commits(workspace_path)
+
+    # Committing moves all uncommitted changes into the commit, anything left over was made by someone else
+    if checked_state is not None:
+        expected_state = dict(checked_state)
+        if autocommit:
+            expected_state["uncommitted_file_changes"] = []
+        save_listing_cache(listing_cache, workspace_path, expected_state, logger)
+
+
+def mirror_workspace(workspace_path, path_filter, logger, listing_cache=None):
+    """
+    Empties the part of the workspace which is about to be rewritten from the source directory.
+
+    Without subtree roots, uncommitted changes are discarded and every top-level entry not ignored
+    by the local `.gitignore` is removed, so the upload recreates the tree from scratch. With subtree
+    roots, only the roots themselves are removed and changes elsewhere in the workspace are kept.
+    Either way the number of calls depends on the number of top-level entries or roots, not on the
+    number of stale files and directories. Files rewritten with unchanged content do not show up
+    as changes in Git.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        path_filter (PathFilterHandler): Handler defining the subtree roots.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
+    """
+    if path_filter.paths:
+        for root in path_filter.paths:
+            logger.info(f"Removing remote directory: {root}")
+            try:
+                PushHandler.remove_directory(root, workspace_path, listing_cache=listing_cache)
+            except exceptions.NotFound:
+                logger.debug(f"Remote directory does not exist: {root}")
+        return
+
+    logger.info("Discarding uncommitted workspace changes...")
+    PushHandler.reset_workspace_changes(workspace_path, clean=True, listing_cache=listing_cache)
+
+    files, directories = PullHandler.get_workspace_path_structure(
+        workspace_path=workspace_path,
+        gitignore_handler=GitignoreHandler(gitignore_path=".gitignore"),
+        listing_cache=listing_cache
+    )
+
+    for directory in directories:
+        logger.info(f"Removing remote directory: {directory}")
+        PushHandler.remove_directory(directory, workspace_path, listing_cache=listing_cache)
+
+    for file_path in files:
+        logger.info(f"Removing remote file: {file_path}")
+        PushHandler.remove_file(file_path, workspace_path, listing_cache=listing_cache)
+
+
+def remove_stale_files(remote_files, local_files, workspace_path, logger, listing_cache=None):
+    """
+    Deletes files from the remote workspace that are not present in the given source file list.
+
+    Args:
+        remote_files (List[str]): Relative paths of files currently present in the workspace.
+        local_files (List[str]): Relative paths of files that should remain in the workspace.
+        workspace_path (str): Fully qualified workspace path.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to keep up to date.
+    """
+    files_to_delete = set(remote_files) - set(local_files)
+    for file_path in sorted(files_to_delete):
+        logger.info(f"Deleting remote file: {file_path}")
+        try:
+            PushHandler.remove_file(file_path, workspace_path, listing_cache=listing_cache)
+        except exceptions.NotFound:
+            logger.warning(f"Remote file already deleted: {file_path}")
+
+
+def remove_empty_directories(workspace_path, gitignore_handler, logger, listing_cache=None, path_filter=None):
+    """
+    Deletes directories from the remote workspace that do not contain any files.
+
+    Args:
+        workspace_path (str): Fully qualified workspace path.
+        gitignore_handler (GitignoreHandler): Handler to filter out ignored paths.
+        logger (logging.Logger): Logger instance for structured logging.
+        listing_cache (ListingCacheHandler, optional): Cache of directory listings to crawl from.
+        path_filter (PathFilterHandler, optional): Handler limiting the cleanup to selected subtrees.
+    """
+    # Every file within the selected subtrees keeps its directory, regardless of glob patterns
+    scope = path_filter.get_scope() if path_filter else None
 
     # Get directories from remote repository
     remote_empty_dirs, remote_nonempty_dirs = PullHandler.get_workspace_directories(
         workspace_path=workspace_path,
-        gitignore_handler=GitignoreHandler(gitignore_path=".gitignore")
+        gitignore_handler=gitignore_handler,
+        listing_cache=listing_cache,
+        path_filter=scope
     )
     # Ger files from remote repository
     remote_files = PullHandler.get_workspace_files(
         workspace_path=workspace_path,
-        gitignore_handler=GitignoreHandler(gitignore_path=".gitignore")
+        gitignore_handler=gitignore_handler,
+        listing_cache=listing_cache,
+        path_filter=scope
     )
     # Get trully empty dirs:
     trully_empty_dirs = PullHandler.get_empty_directories(
         empty_dirs=remote_empty_dirs,
-        files=remote_files
+        files=remote_files,
+        roots=scope.paths if scope else None
     )
 
     if len(trully_empty_dirs) > 0:
         logger.info(f"Deleting empty directories: count of trully directories is {len(trully_empty_dirs)}")
         for empty_dir in trully_empty_dirs:
             logger.info(f"Deleting trully empty directory: {empty_dir}")
-            PushHandler.remove_directory(empty_dir, workspace_path)
-
-    # Commit changes if enabled
-    if autocommit:
-        logger.info("Committing workspace changes...")
-        PushHandler.commit_workspace_changes(workspace_path, message="Automated push from CLI")
-
-    # Push commits if enabled
-    if autopush:
-        logger.info("Pushing git commits...")
-        PushHandler.push_git_commits(workspace_path)
-
-    logger.info("Push completed successfully.")
+            PushHandler.remove_directory(empty_dir, workspace_path, listing_cache=listing_cache)
@@ -0,0 +1,227 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core import exceptions
+from google.cloud import dataform_v1
+from .compile import compile_workspace
+from .handlers.workflow_handler import WorkflowHandler
+from .logger import get_fixed_width_logger
+
+# Number of consecutive failed polls after which an invocation is no longer tracked
+MAX_POLL_FAILURES = 5
+
+
+def run(
+        project_id,
+        region,
+        repository_id,
+        workspace_id,
+        tags=None,
+        targets=None,
+        source_dir=None,
+        include_dependencies=False,
+        include_dependents=False,
+        full_refresh=False,
+        use_compilation_cache=True,
+        cache_dir=None,
+        poll_interval=2.0,
+        max_poll_interval=30.0,
+        logger=get_fixed_width_logger(name="runLogger")
+    ):
+    """
+    Compiles a Google Cloud Dataform workspace once and runs its actions in concurrent workflow invocations.
+
+    One workflow invocation is started per tag and per target (or a single invocation of all actions
+    if none are given). All invocations are tracked from a single polling loop, which logs every
+    action state change as it happens. The polling interval is reset to `poll_interval` whenever
+    something changes and grows up to `max_poll_interval` while nothing does. The function returns
+    as soon as all invocations reach a terminal state. Invocations which fail to start are logged
+    and do not prevent the others from being tracked.
+
+    Args:
+        project_id (str): The Google Cloud project ID where the Dataform repository resides.
+        region (str): The region in which the Dataform repository is hosted.
+        repository_id (str): The unique identifier of the Dataform repository.
+        workspace_id (str): The ID of the workspace to compile and run.
+        tags (List[str], optional): Tags to run, each in its own workflow invocation.
+        targets (List[str], optional): Targets to run as '[[database.]schema.]name', each in its own workflow invocation.
+        source_dir (str, optional): The path to the local directory last pushed to the workspace, see `compile_workspace`.
+        include_dependencies (bool): If True, also runs transitive dependencies of selected actions. Defaults to False.
+        include_dependents (bool): If True, also runs transitive dependents of selected actions. Defaults to False.
+        full_refresh (bool): If True, incremental tables are fully refreshed. Defaults to False.
+        use_compilation_cache (bool): If True, compilation results are cached on disk by content hash. Defaults to True.
+        cache_dir (str, optional): Root cache directory. Defaults to '~/.cache/dataform-cli'.
+        poll_interval (float): Initial and minimal polling interval in seconds, must be positive. Defaults to 2.
+        max_poll_interval (float): Maximal polling interval in seconds, must not be smaller than `poll_interval`. Defaults to 30.
+        logger (logging.Logger): Logger instance for structured logging. A default fixed-width logger is used if not provided.
+
+    Returns:
+        bool: True if all workflow invocations started and succeeded, False otherwise.
+
+    Raises:
+        ValueError: If a polling interval or a target is invalid.
+    """
+    if poll_interval <= 0:
+        raise ValueError(f"Polling interval must be positive, got {poll_interval}")
+    if max_poll_interval < poll_interval:
+        raise ValueError(
+            f"Maximal polling interval ({max_poll_interval}) must not be smaller than the polling interval ({poll_interval})"
+        )
+
+    # Invalid targets are rejected before anything is compiled or started
+    selections = {}
+    for tag in tags or []:
+        selections[f"tag:{tag}"] = dict(tags=[tag])
+    for target in targets or []:
+        selections[f"target:{target}"] = dict(targets=[target])
+    if not selections:
+        selections["all actions"] = dict()
+
+    invocation_configs = {
+        label: WorkflowHandler.build_invocation_config(
+            include_dependencies=include_dependencies,
+            include_dependents=include_dependents,
+            full_refresh=full_refresh,
+            **selection
+        )
+        for label, selection in selections.items()
+    }
+
+    compilation_result_name, errors = compile_workspace(
+        project_id=project_id,
+        region=region,
+        repository_id=repository_id,
+        workspace_id=workspace_id,
+        source_dir=source_dir,
+        use_compilation_cache=use_compilation_cache,
+        cache_dir=cache_dir,
+        logger=logger
+    )
+
+    if errors:
+        logger.error("Compilation failed, no workflow invocations started")
+        return False
+
+    repository_path = WorkflowHandler.get_repository_path(project_id, region, repository_id)
+
+    def create_workflow_invocation(label):
+        workflow_invocation = WorkflowHandler.create_workflow_invocation(
+            repository_path, compilation_result_name, invocation_configs[label]
+        )
+        logger.info(f"Started workflow invocation for {label}: {workflow_invocation.name}")
+        return workflow_invocation.name
+
+    with ThreadPoolExecutor(max_workers=len(invocation_configs)) as executor:
+        futures = {label: executor.submit(create_workflow_invocation, label) for label in invocation_configs}
+
+        pending = {}
+        failed_labels = []
+        for label, future in futures.items():
+            try:
+                pending[future.result()] = label
+            except Exception as e:
+                logger.error(f"Failed to start workflow invocation for {label}: {e}")
+                failed_labels.append(label)
+
+        if not pending:
+            logger.error("No workflow invocations started")
+            return False
+
+        if failed_labels:
+            logger.warning(f"Tracking {len(pending)} started workflow invocations, {len(failed_labels)} failed to start")
+
+        succeeded = track_workflow_invocations(
+            pending=pending,
+            executor=executor,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            logger=logger
+        )
+
+    return succeeded and not failed_labels
+
+
+def track_workflow_invocations(pending, executor, poll_interval, max_poll_interval, logger):
+    """
+    Polls workflow invocations until all of them reach a terminal state, logging action state changes.
+
+    Transient API errors are retried by the handler. An invocation whose polling still fails is
+    logged and polled again in the next round instead of ending the tracking of all invocations,
+    and is given up (counted as failed) after MAX_POLL_FAILURES consecutive failed rounds.
+
+    Args:
+        pending (Dict[str, str]): Workflow invocation names mapped to their labels.
+        executor (concurrent.futures.Executor): Executor used to poll invocations concurrently.
+        poll_interval (float): Initial and minimal polling interval in seconds.
+        max_poll_interval (float): Maximal polling interval in seconds.
+        logger (logging.Logger): Logger instance for structured logging.
+
+    Returns:
+        bool: True if all workflow invocations succeeded, False otherwise.
+    """
+    pending = dict(pending)
+    action_states = {}
+    poll_failures = {}
+    succeeded = True
+    interval = poll_interval
+
+    def poll(name):
+        try:
+            return (
+                name,
+                WorkflowHandler.get_workflow_invocation(name),
+                WorkflowHandler.get_workflow_invocation_actions(name),
+            )
+        except exceptions.GoogleAPICallError as e:
+            logger.warning(f"Failed to poll workflow invocation for {pending[name]}, retrying: {e}")
+            return name, None, None
+
+    while pending:
+        changed = False
+
+        for name, workflow_invocation, actions in executor.map(poll, list(pending)):
+            label = pending[name]
+
+            if workflow_invocation is None:
+                poll_failures[name] = poll_failures.get(name, 0) + 1
+                if poll_failures[name] >= MAX_POLL_FAILURES:
+                    logger.error(f"Giving up tracking workflow invocation for {label}: {name}")
+                    succeeded = False
+                    del pending[name]
+                    changed = True
+                continue
+
+            poll_failures.pop(name, None)
+
+            for action in actions:
+                target = WorkflowHandler.format_target(action.target)
+                state = action.state.name
+
+                if action_states.get((name, target)) == state:
+                    continue
+
+                action_states[(name, target)] = state
+                changed = True
+
+                if action.failure_reason:
+                    logger.error(f"[{label}] {target}: {state} - {action.failure_reason}")
+                else:
+                    logger.info(f"[{label}] {target}: {state}")
+
+            if workflow_invocation.state in WorkflowHandler.TERMINAL_STATES:
+                state = workflow_invocation.state.name
+                if workflow_invocation.state == dataform_v1.WorkflowInvocation.State.SUCCEEDED:
+                    logger.info(f"Workflow invocation for {label} finished: {state}")
+                else:
+                    logger.error(f"Workflow invocation for {label} finished: {state}")
+                    succeeded = False
+
+                del pending[name]
+                changed = True
+
+        if not pending:
+            break
+
+        interval = poll_interval if changed else min(interval * 1.5, max_poll_interval)
+        time.sleep(interval)
+
+    return succeeded
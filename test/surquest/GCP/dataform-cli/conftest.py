@@ -0,0 +1,147 @@
+import os
+import time
+from collections import Counter
+from types import SimpleNamespace
+import pytest
+import google.auth
+from google.auth.credentials import AnonymousCredentials
+
+# The Dataform client is created when the handlers are imported, which requires credentials.
+# Tests never talk to the API, so anonymous credentials are sufficient.
+google.auth.default = lambda *args, **kwargs: (AnonymousCredentials(), "test-project")
+
+from google.api_core import exceptions
+from google.cloud import dataform_v1
+from src.surquest.GCP.dataform_cli.handlers.dataform_handler import DataformHandler
+
+
+class FakeDataformClient:
+    """
+    In-memory stand-in for the Dataform client holding a single workspace tree.
+    Counts calls per method and optionally sleeps on each call to simulate RPC latency.
+    The initial files are committed; uncommitted changes are derived from the last commit.
+    """
+
+    def __init__(self, files, latency=0.0):
+        self.files = dict(files)
+        self.directories = set()
+        for file_path in self.files:
+            self._add_parents(file_path)
+        self.committed_files = dict(self.files)
+        self.commits = ["initial"]
+        self.commits_ahead = 0
+        self.calls = Counter()
+        self.latency = latency
+
+    def _add_parents(self, file_path):
+        parent = os.path.dirname(file_path)
+        while parent:
+            self.directories.add(parent)
+            parent = os.path.dirname(parent)
+
+    def _call(self, method):
+        self.calls[method] += 1
+        time.sleep(self.latency)
+
+    def add_file(self, file_path, contents=b""):
+        """
+        Adds a file without going through the API, like an edit made by someone else.
+        """
+        self.files[file_path] = contents
+        self._add_parents(file_path)
+
+    @staticmethod
+    def workspace_path(project_id, region, repository_id, workspace_id):
+        return f"projects/{project_id}/locations/{region}/repositories/{repository_id}/workspaces/{workspace_id}"
+
+    def query_directory_contents(self, request):
+        self._call("query_directory_contents")
+        path = request.path or ""
+        if path and path not in self.directories:
+            raise exceptions.NotFound(f"Directory not found: {path}")
+
+        prefix = f"{path}/" if path else ""
+        entries = [
+            dataform_v1.DirectoryEntry(directory=directory)
+            for directory in sorted(self.directories)
+            if directory.startswith(prefix) and "/" not in directory[len(prefix):]
+        ]
+        entries += [
+            dataform_v1.DirectoryEntry(file=file_path)
+            for file_path in sorted(self.files)
+            if file_path.startswith(prefix) and "/" not in file_path[len(prefix):]
+        ]
+        return dataform_v1.QueryDirectoryContentsResponse(directory_entries=entries)
+
+    def write_file(self, request):
+        self._call("write_file")
+        self.files[request.path] = request.contents
+        self._add_parents(request.path)
+
+    def remove_file(self, request):
+        self._call("remove_file")
+        if request.path not in self.files:
+            raise exceptions.NotFound(f"File not found: {request.path}")
+        del self.files[request.path]
+
+    def remove_directory(self, request):
+        self._call("remove_directory")
+        if request.path not in self.directories:
+            raise exceptions.NotFound(f"Directory not found: {request.path}")
+
+        prefix = f"{request.path}/"
+        self.files = {path: contents for path, contents in self.files.items() if not path.startswith(prefix)}
+        self.directories = {
+            directory for directory in self.directories
+            if directory != request.path and not directory.startswith(prefix)
+        }
+
+    def reset_workspace_changes(self, request):
+        # All remote files are treated as committed, so there is nothing to discard
+        self._call("reset_workspace_changes")
+
+    def commit_workspace_changes(self, request):
+        self._call("commit_workspace_changes")
+        self.committed_files = dict(self.files)
+        self.commits.append(f"commit-{len(self.commits)}")
+        self.commits_ahead += 1
+
+    def push_git_commits(self, request):
+        self._call("push_git_commits")
+        self.commits_ahead = 0
+
+    def fetch_repository_history(self, request):
+        self._call("fetch_repository_history")
+        return [SimpleNamespace(commit_sha=self.commits[0])]
+
+    def fetch_git_ahead_behind(self, request):
+        self._call("fetch_git_ahead_behind")
+        return SimpleNamespace(commits_ahead=self.commits_ahead, commits_behind=0)
+
+    def fetch_file_git_statuses(self, request):
+        self._call("fetch_file_git_statuses")
+        changes = []
+        for path in sorted(self.files.keys() | self.committed_files.keys()):
+            if path not in self.committed_files:
+                state = "ADDED"
+            elif path not in self.files:
+                state = "DELETED"
+            elif self.files[path] != self.committed_files[path]:
+                state = "MODIFIED"
+            else:
+                continue
+            changes.append(SimpleNamespace(path=path, state=SimpleNamespace(name=state)))
+        return SimpleNamespace(uncommitted_file_changes=changes)
+
+
+@pytest.fixture
+def fake_dataform_client(monkeypatch):
+    """
+    Returns a factory installing a FakeDataformClient with the given files as the client of all handlers.
+    """
+    def install(files, latency=0.0):
+        client = FakeDataformClient(files, latency=latency)
+        monkeypatch.setattr(DataformHandler, "dataform_client", client)
+        return client
+
+    return install
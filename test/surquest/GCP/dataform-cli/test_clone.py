@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+import pytest
+from src.surquest.GCP.dataform_cli import clone as clone_module
+from src.surquest.GCP.dataform_cli.clone import clone, transfer_files
+from src.surquest.GCP.dataform_cli.handlers.pull_handler import PullHandler
+from src.surquest.GCP.dataform_cli.handlers.push_handler import PushHandler
+
+SOURCE = "projects/p/locations/r/repositories/repo/workspaces/dev"
+TARGET = "projects/p/locations/r/repositories/repo/workspaces/release"
+LOGGER = logging.getLogger("test-clone")
+
+
+class TestTransferFiles:
+
+    @pytest.fixture(autouse=True)
+    def stub_handlers(self, monkeypatch):
+        """
+        Replaces Dataform reads and writes with in-memory stubs which track
+        how many files are read but not yet written.
+        """
+        self.written = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.failing_reads = set()
+        self.failing_writes = set()
+
+        def pull_file(file_path, workspace_path):
+            assert workspace_path == SOURCE
+            if file_path in self.failing_reads:
+                raise RuntimeError("read failed")
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return file_path.encode("utf-8")
+
+        def write_file_contents(file_contents, target_location, workspace_path, listing_cache=None):
+            assert workspace_path == TARGET
+            time.sleep(0.001)  # slow writers make readers block on the full queue
+            with self.lock:
+                self.in_flight -= 1
+            if target_location in self.failing_writes:
+                raise RuntimeError("write failed")
+            self.written[target_location] = file_contents
+
+        monkeypatch.setattr(PullHandler, "pull_file", staticmethod(pull_file))
+        monkeypatch.setattr(PushHandler, "write_file_contents", staticmethod(write_file_contents))
+
+    def test_all_files_transferred(self):
+        files = [f"definitions/table_{i}.sqlx" for i in range(100)]
+
+        failed = transfer_files(files, SOURCE, TARGET, workers=4, logger=LOGGER)
+
+        assert failed == []
+        assert self.written == {file_path: file_path.encode("utf-8") for file_path in files}
+
+    def test_queue_is_bounded(self):
+        workers = 2
+        files = [f"definitions/table_{i}.sqlx" for i in range(200)]
+
+        transfer_files(files, SOURCE, TARGET, workers=workers, logger=LOGGER)
+
+        # Queue capacity plus one file held by each reader and each writer
+        assert self.max_in_flight <= 2 * workers + workers + workers
+
+    def test_failures_are_collected(self):
+        files = [f"definitions/table_{i}.sqlx" for i in range(10)]
+        self.failing_reads = {files[1]}
+        self.failing_writes = {files[7]}
+
+        failed = transfer_files(files, SOURCE, TARGET, workers=3, logger=LOGGER)
+
+        assert failed == sorted([files[1], files[7]])
+        assert set(self.written) == set(files) - {files[1], files[7]}
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_invalid_workers(self, workers):
+        with pytest.raises(ValueError):
+            transfer_files(["a.sqlx"], SOURCE, TARGET, workers=workers, logger=LOGGER)
+
+
+class TestClone:
+
+    def test_no_cleanup_or_commit_on_failure(self, monkeypatch):
+        calls = []
+
+        def get_workspace_files(workspace_path, gitignore_handler=None, listing_cache=None, path_filter=None):
+            return ["definitions/a.sqlx", "definitions/b.sqlx"]
+
+        def pull_file(file_path, workspace_path):
+            if file_path == ".gitignore":
+                raise clone_module.exceptions.NotFound("no .gitignore")
+            if file_path == "definitions/b.sqlx":
+                raise RuntimeError("read failed")
+            return b"select 1"
+
+        monkeypatch.setattr(PullHandler, "get_workspace_files", staticmethod(get_workspace_files))
+        monkeypatch.setattr(PullHandler, "pull_file", staticmethod(pull_file))
+        monkeypatch.setattr(PushHandler, "write_file_contents", staticmethod(lambda *args, **kwargs: None))
+        monkeypatch.setattr(clone_module, "remove_stale_files", lambda **kwargs: calls.append("remove_stale_files"))
+        monkeypatch.setattr(clone_module, "remove_empty_directories", lambda **kwargs: calls.append("remove_empty_directories"))
+        monkeypatch.setattr(PushHandler, "commit_workspace_changes", staticmethod(lambda *args, **kwargs: calls.append("commit")))
+        monkeypatch.setattr(PushHandler, "push_git_commits", staticmethod(lambda *args, **kwargs: calls.append("push")))
+
+        succeeded = clone("p", "r", "repo", "dev", "release", workers=2, logger=LOGGER)
+
+        assert succeeded is False
+        assert calls == []
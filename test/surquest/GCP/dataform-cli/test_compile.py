@@ -0,0 +1,185 @@
+import logging
+from types import SimpleNamespace
+import pytest
+from google.api_core import exceptions
+from src.surquest.GCP.dataform_cli.compile import compile_workspace
+from src.surquest.GCP.dataform_cli.handlers.compilation_cache_handler import CompilationCacheHandler
+from src.surquest.GCP.dataform_cli.handlers.compile_handler import CompileHandler
+
+WORKSPACE = "projects/p/locations/r/repositories/repo/workspaces/dev"
+LOGGER = logging.getLogger("test-compile")
+
+
+class TestCompileWorkspace:
+
+    @pytest.fixture(autouse=True)
+    def stub_handlers(self, tmp_path, monkeypatch):
+        """
+        Replaces compilation calls with stubs. Every created compilation result gets a new name
+        and the configured errors; results listed in `self.deleted` no longer exist.
+        """
+        self.cache_dir = tmp_path / "cache"
+        self.source_dir = tmp_path / "src"
+        (self.source_dir / "definitions").mkdir(parents=True)
+        (self.source_dir / "definitions" / "a.sqlx").write_bytes(b"select 1")
+
+        self.created = []
+        self.deleted = set()
+        self.errors = []
+        self.workspace_hash = "clean"
+
+        def create_compilation_result(repository_path, workspace_path):
+            name = f"{repository_path}/compilationResults/{len(self.created) + 1}"
+            self.created.append(name)
+            return SimpleNamespace(name=name, compilation_errors=[
+                SimpleNamespace(
+                    path=error["path"],
+                    message=error["message"],
+                    action_target=SimpleNamespace(database="", schema="", name=""),
+                )
+                for error in self.errors
+            ])
+
+        def get_compilation_result(name):
+            if name in self.deleted:
+                raise exceptions.NotFound(f"Compilation result not found: {name}")
+            return SimpleNamespace(name=name)
+
+        monkeypatch.setattr(CompileHandler, "create_compilation_result", staticmethod(create_compilation_result))
+        monkeypatch.setattr(CompileHandler, "get_compilation_result", staticmethod(get_compilation_result))
+        monkeypatch.setattr(CompileHandler, "get_workspace_hash", staticmethod(lambda workspace_path: self.workspace_hash))
+
+    def compile(self, **kwargs):
+        kwargs = dict(dict(source_dir=str(self.source_dir), cache_dir=self.cache_dir), **kwargs)
+        return compile_workspace("p", "r", "repo", "dev", logger=LOGGER, **kwargs)
+
+    def test_cache_hit_returns_stored_result(self):
+        self.errors = [{"path": "definitions/a.sqlx", "message": "syntax error"}]
+        name, errors = self.compile()
+
+        self.errors = []
+        assert self.compile() == (name, errors)
+        assert errors == [{"path": "definitions/a.sqlx", "action": "", "message": "syntax error"}]
+        assert len(self.created) == 1
+
+    def test_deleted_result_is_evicted_and_recompiled(self):
+        name, _ = self.compile()
+        self.deleted.add(name)
+
+        new_name, _ = self.compile()
+
+        assert new_name != name
+        assert self.compile()[0] == new_name
+        assert len(self.created) == 2
+
+    def test_changed_local_file_recompiles(self):
+        self.compile()
+        (self.source_dir / "definitions" / "a.sqlx").write_bytes(b"select 2")
+
+        self.compile()
+
+        assert len(self.created) == 2
+
+    def test_changed_workspace_status_recompiles(self):
+        self.compile()
+        self.workspace_hash = "uncommitted edit"
+
+        self.compile()
+
+        assert len(self.created) == 2
+
+    def test_no_cache_without_source_dir(self):
+        self.compile(source_dir=None)
+        self.compile(source_dir=None)
+
+        assert len(self.created) == 2
+        assert not self.cache_dir.exists()
+
+    def test_no_cache_when_disabled(self):
+        self.compile(use_compilation_cache=False)
+        self.compile(use_compilation_cache=False)
+
+        assert len(self.created) == 2
+
+
+class TestCompilationCacheHandler:
+
+    def test_oldest_entries_are_evicted(self, tmp_path):
+        cache = CompilationCacheHandler(WORKSPACE, cache_dir=tmp_path, max_entries=2)
+
+        cache.set("first", "results/1", [])
+        cache.set("second", "results/2", [])
+        cache.set("first", "results/3", [])  # storing again makes it the most recent entry
+        cache.set("third", "results/4", [])
+
+        assert cache.get("second") is None
+        assert cache.get("first") == {"name": "results/3", "errors": []}
+        assert cache.get("third") == {"name": "results/4", "errors": []}
+
+    def test_remove(self, tmp_path):
+        cache = CompilationCacheHandler(WORKSPACE, cache_dir=tmp_path)
+        cache.set("first", "results/1", [])
+
+        cache.remove("first")
+
+        assert cache.get("first") is None
+
+
+class TestTreeHash:
+
+    def test_order_does_not_matter(self):
+        files = [("definitions/a.sqlx", b"select 1"), ("definitions/b.sqlx", b"select 2")]
+
+        assert CompileHandler.get_tree_hash(files) == CompileHandler.get_tree_hash(reversed(files))
+
+    def test_rename_changes_hash(self):
+        original = CompileHandler.get_tree_hash([("definitions/a.sqlx", b"select 1")])
+        renamed = CompileHandler.get_tree_hash([("definitions/b.sqlx", b"select 1")])
+
+        assert original != renamed
+
+    def test_content_change_changes_hash(self):
+        original = CompileHandler.get_tree_hash([("definitions/a.sqlx", b"select 1")])
+        changed = CompileHandler.get_tree_hash([("definitions/a.sqlx", b"select 2")])
+
+        assert original != changed
+
+
+class TestWorkspaceHash:
+
+    @pytest.fixture(autouse=True)
+    def stub_client(self, monkeypatch):
+        """
+        Stub Dataform client with configurable uncommitted changes and file contents.
+        """
+        self.changes = []
+        self.contents = {}
+        self.reads = []
+
+        def read_file(request):
+            self.reads.append(request.path)
+            return SimpleNamespace(file_contents=self.contents[request.path])
+
+        monkeypatch.setattr(CompileHandler, "dataform_client", SimpleNamespace(
+            fetch_git_ahead_behind=lambda request: SimpleNamespace(commits_ahead=0, commits_behind=0),
+            fetch_file_git_statuses=lambda request: SimpleNamespace(uncommitted_file_changes=[
+                SimpleNamespace(path=path, state=SimpleNamespace(name=state)) for path, state in self.changes
+            ]),
+            read_file=read_file,
+        ))
+
+    def test_content_of_uncommitted_change_changes_hash(self):
+        self.changes = [("definitions/a.sqlx", "MODIFIED")]
+        self.contents["definitions/a.sqlx"] = b"select 1"
+        first = CompileHandler.get_workspace_hash(WORKSPACE)
+
+        self.contents["definitions/a.sqlx"] = b"select 2"
+
+        assert CompileHandler.get_workspace_hash(WORKSPACE) != first
+
+    def test_deleted_files_are_not_read(self):
+        clean = CompileHandler.get_workspace_hash(WORKSPACE)
+        self.changes = [("definitions/a.sqlx", "DELETED")]
+
+        assert CompileHandler.get_workspace_hash(WORKSPACE) != clean
+        assert self.reads == []
@@ -0,0 +1,192 @@
+import logging
+from types import SimpleNamespace
+import pytest
+from google.api_core import exceptions
+from src.surquest.GCP.dataform_cli import pull as pull_module
+from src.surquest.GCP.dataform_cli.handlers.listing_cache_handler import ListingCacheHandler
+from src.surquest.GCP.dataform_cli.handlers.pull_handler import PullHandler
+
+WORKSPACE = "projects/p/locations/r/repositories/repo/workspaces/dev"
+STATE = {"head_commit": "abc", "commits_ahead": 0, "commits_behind": 0, "uncommitted_file_changes": []}
+
+
+class TestListingCacheHandler:
+
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, tmp_path):
+        """
+        Create a listing cache with a small tree:
+        root: README.md, definitions/
+        definitions: definitions/a.sqlx, definitions/marts/
+        definitions/marts: definitions/marts/b.sqlx
+        """
+        self.cache_dir = tmp_path
+        self.cache = ListingCacheHandler(WORKSPACE, cache_dir=tmp_path)
+        self.cache.set(None, [{"file": "README.md"}, {"directory": "definitions"}])
+        self.cache.set("definitions", [{"file": "definitions/a.sqlx"}, {"directory": "definitions/marts"}])
+        self.cache.set("definitions/marts", [{"file": "definitions/marts/b.sqlx"}])
+
+    def test_load_with_matching_state(self):
+        self.cache.save(STATE)
+
+        reloaded = ListingCacheHandler(WORKSPACE, cache_dir=self.cache_dir)
+
+        assert reloaded.load(STATE) is True
+        assert reloaded.get("definitions/marts") == [{"file": "definitions/marts/b.sqlx"}]
+
+    def test_load_with_changed_state(self):
+        self.cache.save(STATE)
+
+        reloaded = ListingCacheHandler(WORKSPACE, cache_dir=self.cache_dir)
+
+        assert reloaded.load(dict(STATE, head_commit="def")) is False
+        assert reloaded.get(None) is None
+
+    def test_load_of_other_workspace(self):
+        self.cache.save(STATE)
+
+        other = ListingCacheHandler(WORKSPACE.replace("dev", "prod"), cache_dir=self.cache_dir)
+
+        assert other.load(STATE) is False
+
+    def test_load_of_corrupted_file(self):
+        self.cache.save(STATE)
+        with open(self.cache.cache_path, "w") as f:
+            f.write("{not json")
+
+        assert self.cache.load(STATE) is False
+
+    def test_overwrite_of_listed_file_keeps_listings(self):
+        self.cache.record_write("definitions/marts/b.sqlx")
+
+        assert self.cache.get(None) is not None
+        assert self.cache.get("definitions") is not None
+        assert self.cache.get("definitions/marts") is not None
+
+    def test_new_file_drops_ancestor_listings(self):
+        self.cache.record_write("definitions/marts/c.sqlx")
+
+        assert self.cache.get("definitions/marts") is None
+        assert self.cache.get("definitions") is None
+        assert self.cache.get(None) is None
+
+    def test_new_file_in_uncached_directory_drops_ancestor_listings(self):
+        self.cache.record_write("definitions/staging/c.sqlx")
+
+        assert self.cache.get("definitions") is None
+        assert self.cache.get(None) is None
+        assert self.cache.get("definitions/marts") is not None
+
+    def test_file_removal_drops_parent_listing(self):
+        self.cache.record_removal("definitions/a.sqlx")
+
+        assert self.cache.get("definitions") is None
+        assert self.cache.get(None) is not None
+        assert self.cache.get("definitions/marts") is not None
+
+    def test_directory_removal_drops_parent_and_subtree(self):
+        self.cache.record_removal("definitions")
+
+        assert self.cache.get(None) is None
+        assert self.cache.get("definitions") is None
+        assert self.cache.get("definitions/marts") is None
+
+    def test_removal_keeps_sibling_with_common_prefix(self):
+        self.cache.set("definitions/marts_legacy", [{"file": "definitions/marts_legacy/c.sqlx"}])
+
+        self.cache.record_removal("definitions/marts")
+
+        assert self.cache.get("definitions/marts") is None
+        assert self.cache.get("definitions/marts_legacy") is not None
+
+    def test_clear_removes_file(self):
+        self.cache.save(STATE)
+
+        self.cache.clear()
+
+        assert self.cache.get(None) is None
+        assert ListingCacheHandler(WORKSPACE, cache_dir=self.cache_dir).load(STATE) is False
+
+    def test_recorded_changes_are_consistent(self):
+        self.cache.record_write("definitions/c.sqlx")
+        self.cache.record_removal("definitions/marts")
+        current_state = dict(STATE, uncommitted_file_changes=[
+            ["definitions/c.sqlx", "ADDED"],
+            ["definitions/marts/b.sqlx", "DELETED"],
+        ])
+
+        assert self.cache.is_consistent(STATE, current_state) is True
+
+    def test_unrecorded_change_is_inconsistent(self):
+        self.cache.record_write("definitions/c.sqlx")
+        current_state = dict(STATE, uncommitted_file_changes=[
+            ["definitions/c.sqlx", "ADDED"],
+            ["definitions/new.sqlx", "ADDED"],
+        ])
+
+        assert self.cache.is_consistent(STATE, current_state) is False
+
+    def test_new_commit_is_inconsistent(self):
+        assert self.cache.is_consistent(STATE, dict(STATE, commits_ahead=1)) is False
+
+    def test_discarded_changes_are_consistent_after_clear(self):
+        initial_state = dict(STATE, uncommitted_file_changes=[["definitions/draft.sqlx", "ADDED"]])
+
+        assert self.cache.is_consistent(initial_state, STATE) is False
+
+        self.cache.clear()
+
+        assert self.cache.is_consistent(initial_state, STATE) is True
+
+
+class TestWorkspaceState:
+
+    @staticmethod
+    def stub_client(history=None, history_error=None):
+        """
+        Create a stub Dataform client returning the given repository history.
+        """
+        def fetch_repository_history(request):
+            if history_error:
+                raise history_error
+            return iter(history or [])
+
+        return SimpleNamespace(
+            fetch_repository_history=fetch_repository_history,
+            fetch_git_ahead_behind=lambda request: SimpleNamespace(commits_ahead=1, commits_behind=0),
+            fetch_file_git_statuses=lambda request: SimpleNamespace(uncommitted_file_changes=[
+                SimpleNamespace(path="definitions/a.sqlx", state=SimpleNamespace(name="ADDED")),
+            ]),
+        )
+
+    def test_state_of_repository_without_git_remote(self, monkeypatch):
+        monkeypatch.setattr(PullHandler, "dataform_client", self.stub_client(
+            history=[SimpleNamespace(commit_sha="abc")]
+        ))
+
+        assert PullHandler.get_workspace_state(WORKSPACE) == {
+            "head_commit": "abc",
+            "commits_ahead": 1,
+            "commits_behind": 0,
+            "uncommitted_file_changes": [["definitions/a.sqlx", "ADDED"]],
+        }
+
+    def test_no_state_of_repository_with_git_remote(self, monkeypatch):
+        monkeypatch.setattr(PullHandler, "dataform_client", self.stub_client(
+            history_error=exceptions.FailedPrecondition("repository has a Git remote")
+        ))
+
+        assert PullHandler.get_workspace_state(WORKSPACE) is None
+
+    def test_no_state_without_commits(self, monkeypatch):
+        monkeypatch.setattr(PullHandler, "dataform_client", self.stub_client(history=[]))
+
+        assert PullHandler.get_workspace_state(WORKSPACE) is None
+
+    def test_cache_disabled_without_state(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(PullHandler, "get_workspace_state", staticmethod(lambda workspace_path: None))
+
+        listing_cache, state = pull_module.open_listing_cache(WORKSPACE, tmp_path, logging.getLogger("test"))
+
+        assert listing_cache is None
+        assert state is None
@@ -0,0 +1,40 @@
+import pytest
+from src.surquest.GCP.dataform_cli.handlers.path_filter_handler import PathFilterHandler
+
+
+class TestPathFilterHandler:
+
+    def test_no_filters_select_everything(self):
+        handler = PathFilterHandler()
+
+        assert handler.roots == [None]
+        assert handler.is_selected("definitions/marts/orders.sqlx") is True
+
+    @pytest.mark.parametrize("paths, expected", [
+        (["definitions/marts/"], ["definitions/marts"]),
+        (["./includes"], ["includes"]),
+        (["definitions", "definitions/marts"], ["definitions"]),
+        (["definitions", "."], []),
+    ])
+    def test_paths_are_normalized(self, paths, expected):
+        assert PathFilterHandler(paths=paths).paths == expected
+
+    def test_path_limits_scope(self):
+        handler = PathFilterHandler(paths=["definitions/marts"])
+
+        assert handler.is_selected("definitions/marts/orders.sqlx") is True
+        assert handler.is_selected("definitions/marts_legacy/orders.sqlx") is False
+        assert handler.is_selected("includes/constants.js") is False
+
+    def test_include_and_exclude_patterns(self):
+        handler = PathFilterHandler(include=["*.sqlx"], exclude=["*/tmp_*"])
+
+        assert handler.is_selected("definitions/orders.sqlx") is True
+        assert handler.is_selected("definitions/tmp_orders.sqlx") is False
+        assert handler.is_selected("includes/constants.js") is False
+
+    def test_scope_drops_patterns(self):
+        scope = PathFilterHandler(paths=["definitions"], include=["*.sqlx"]).get_scope()
+
+        assert scope.paths == ["definitions"]
+        assert scope.is_selected("definitions/helpers.js") is True
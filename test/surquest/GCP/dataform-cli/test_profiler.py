@@ -0,0 +1,65 @@
+import logging
+import pstats
+import time
+import tracemalloc
+import pytest
+from src.surquest.GCP.dataform_cli.profiler import profile
+
+LOGGER = logging.getLogger("test-profiler")
+
+
+def busy_block():
+    return sum(i * i for i in range(10000))
+
+
+class TestProfile:
+
+    def test_cprofile_writes_stats(self, tmp_path):
+        output_path = tmp_path / "run.prof"
+
+        with profile("cprofile", output_path=str(output_path), top=5, logger=LOGGER):
+            busy_block()
+
+        stats = pstats.Stats(str(output_path))
+        assert any(function[2] == "busy_block" for function in stats.stats)
+
+    def test_tracemalloc_writes_snapshot(self, tmp_path):
+        output_path = tmp_path / "run.tracemalloc"
+
+        with profile("tracemalloc", output_path=str(output_path), top=5, logger=LOGGER):
+            busy_block()
+
+        assert isinstance(tracemalloc.Snapshot.load(str(output_path)), tracemalloc.Snapshot)
+        assert not tracemalloc.is_tracing()
+
+    def test_tracemalloc_snapshot_is_taken_at_peak(self, tmp_path):
+        output_path = tmp_path / "run.tracemalloc"
+
+        with profile("tracemalloc", output_path=str(output_path), top=5, logger=LOGGER):
+            chunks = [bytearray(1024 * 1024) for _ in range(20)]
+            time.sleep(0.3)  # give the sampler time to see the peak
+            del chunks
+
+        snapshot = tracemalloc.Snapshot.load(str(output_path))
+        assert sum(stat.size for stat in snapshot.statistics("filename")) > 20 * 1024 * 1024
+
+    @pytest.mark.parametrize("profiler, file_name", [("cprofile", "run.prof"), ("tracemalloc", "run.tracemalloc")])
+    def test_report_is_written_on_exit(self, tmp_path, profiler, file_name):
+        output_path = tmp_path / file_name
+
+        with pytest.raises(SystemExit):
+            with profile(profiler, output_path=str(output_path), top=5, logger=LOGGER):
+                busy_block()
+                raise SystemExit(1)
+
+        assert output_path.exists()
+        if profiler == "cprofile":
+            pstats.Stats(str(output_path))
+        else:
+            tracemalloc.Snapshot.load(str(output_path))
+
+    @pytest.mark.parametrize("kwargs", [dict(profiler="yappi"), dict(top=0)])
+    def test_invalid_arguments(self, tmp_path, kwargs):
+        with pytest.raises(ValueError):
+            with profile(output_path=str(tmp_path / "out"), logger=LOGGER, **kwargs):
+                pass
@@ -0,0 +1,92 @@
+import logging
+from types import SimpleNamespace
+import pytest
+from src.surquest.GCP.dataform_cli.handlers import push_handler as push_handler_module
+from src.surquest.GCP.dataform_cli.handlers.listing_cache_handler import ListingCacheHandler
+from src.surquest.GCP.dataform_cli.push import push
+
+WORKSPACE = "projects/p/locations/r/repositories/repo/workspaces/dev"
+LOGGER = logging.getLogger("test-push")
+
+
+class TestPushListingCache:
+
+    @pytest.fixture(autouse=True)
+    def trees(self, tmp_path, monkeypatch, fake_dataform_client):
+        """
+        Local tree with two files, remote tree with an outdated and a stale file.
+        """
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(push_handler_module, "google_auth_default", lambda: (
+            SimpleNamespace(get_cred_info=lambda: {"principal": "ci@example.com"}), "test-project"
+        ))
+        self.cache_dir = tmp_path / "cache"
+
+        self.local_files = {
+            "definitions/a.sqlx": b"select 2",
+            "definitions/marts/b.sqlx": b"select 2",
+        }
+        for relative_path, contents in self.local_files.items():
+            local_path = tmp_path / "src" / relative_path
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path.write_bytes(contents)
+
+        self.client = fake_dataform_client({
+            "definitions/a.sqlx": b"select 1",
+            "definitions/old.sqlx": b"select 0",
+        })
+
+    def push(self, autocommit=True):
+        push(
+            "p", "r", "repo", "dev", "src",
+            autocommit=autocommit,
+            autopush=autocommit,
+            cache_dir=self.cache_dir,
+            logger=LOGGER
+        )
+
+    def cache_is_saved(self):
+        return ListingCacheHandler(WORKSPACE, cache_dir=self.cache_dir)._read() is not None
+
+    def on_first_call(self, method, callback):
+        """
+        Runs the callback right before the first call of a fake client method.
+        """
+        original = getattr(self.client, method)
+        called = []
+
+        def wrapper(request):
+            if not called:
+                called.append(request)
+                callback()
+            return original(request)
+
+        setattr(self.client, method, wrapper)
+
+    @pytest.mark.parametrize("autocommit", [True, False])
+    def test_cache_is_reused(self, autocommit):
+        self.push(autocommit=autocommit)
+        assert self.cache_is_saved()
+
+        queries = self.client.calls["query_directory_contents"]
+        self.push(autocommit=autocommit)
+
+        assert self.client.calls["query_directory_contents"] == queries
+        assert self.client.files == self.local_files
+
+    def test_remote_change_during_push_drops_cache(self):
+        self.on_first_call("write_file", lambda: self.client.add_file("definitions/new.sqlx"))
+
+        self.push()
+        assert not self.cache_is_saved()
+
+        # The next push crawls the workspace again and deletes the file as stale
+        self.push()
+        assert self.client.files == self.local_files
+
+    def test_remote_change_after_commit_drops_cache(self):
+        self.on_first_call("push_git_commits", lambda: self.client.add_file("definitions/new.sqlx"))
+
+        self.push()
+
+        assert not self.cache_is_saved()
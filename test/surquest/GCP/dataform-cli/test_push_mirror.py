@@ -0,0 +1,76 @@
+import logging
+import time
+import pytest
+from src.surquest.GCP.dataform_cli.push import push
+
+LOGGER = logging.getLogger("test-push-mirror")
+
+
+class TestPushMirror:
+    """
+    Compares the default push with mirror mode on a high-churn tree, where most remote
+    files and directories are stale. Run with `-s` to see call counts and timings.
+    """
+
+    LATENCY = 0.001
+
+    @pytest.fixture(autouse=True)
+    def trees(self, tmp_path, monkeypatch, fake_dataform_client):
+        monkeypatch.chdir(tmp_path)
+        self.fake_dataform_client = fake_dataform_client
+
+        self.local_files = {"includes/constants.js": b"module.exports = {};"}
+        for domain in range(10):
+            for table in range(5):
+                self.local_files[f"definitions/domain_{domain}/table_{table}.sqlx"] = b"select 2"
+
+        for relative_path, contents in self.local_files.items():
+            local_path = tmp_path / "src" / relative_path
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            local_path.write_bytes(contents)
+
+        # Same layout with old contents, plus stale files next to them and whole stale subtrees
+        self.remote_files = {relative_path: b"select 1" for relative_path in self.local_files}
+        for domain in range(10):
+            for table in range(5):
+                self.remote_files[f"definitions/domain_{domain}/old_table_{table}.sqlx"] = b"select 0"
+        for legacy in range(20):
+            for table in range(10):
+                self.remote_files[f"definitions/legacy_{legacy}/staging/table_{table}.sqlx"] = b"select 0"
+                self.remote_files[f"legacy/area_{legacy}/table_{table}.sqlx"] = b"select 0"
+
+    def push(self, mirror):
+        client = self.fake_dataform_client(self.remote_files, latency=self.LATENCY)
+
+        start = time.perf_counter()
+        push(
+            "p", "r", "repo", "dev", "src",
+            autocommit=False,
+            autopush=False,
+            use_listing_cache=False,
+            mirror=mirror,
+            logger=LOGGER
+        )
+        elapsed = time.perf_counter() - start
+
+        print(f"mirror={mirror}: {elapsed:.3f}s, {sum(client.calls.values())} calls, {dict(client.calls)}")
+        return client
+
+    def test_mirror_needs_fewer_calls(self):
+        default_client = self.push(mirror=False)
+        mirror_client = self.push(mirror=True)
+
+        for client in (default_client, mirror_client):
+            assert client.files == self.local_files
+            assert client.directories == {
+                "definitions", "includes", *(f"definitions/domain_{domain}" for domain in range(10))
+            }
+
+        def cleanup_calls(client):
+            return sum(
+                client.calls[method]
+                for method in ("query_directory_contents", "remove_file", "remove_directory")
+            )
+
+        assert cleanup_calls(mirror_client) * 10 < cleanup_calls(default_client)
+        assert mirror_client.calls["write_file"] == default_client.calls["write_file"] == len(self.local_files)
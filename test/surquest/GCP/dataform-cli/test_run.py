@@ -0,0 +1,93 @@
+import logging
+from types import SimpleNamespace
+import pytest
+from google.api_core import exceptions
+from google.cloud import dataform_v1
+from src.surquest.GCP.dataform_cli import run as run_module
+from src.surquest.GCP.dataform_cli.handlers.workflow_handler import WorkflowHandler
+
+LOGGER = logging.getLogger("test-run")
+State = dataform_v1.WorkflowInvocation.State
+
+
+class TestRun:
+
+    @pytest.fixture(autouse=True)
+    def stub_handlers(self, monkeypatch):
+        """
+        Replaces compilation and workflow invocation calls with stubs. Invocations
+        are named after their tag and succeed on the second successful poll.
+        """
+        self.failing_creates = set()
+        self.failing_polls = {}
+        self.polls = {}
+
+        def create_workflow_invocation(repository_path, compilation_result_name, invocation_config):
+            tag = invocation_config.included_tags[0]
+            if tag in self.failing_creates:
+                raise exceptions.PermissionDenied("create failed")
+            return SimpleNamespace(name=f"invocations/{tag}")
+
+        def get_workflow_invocation(name):
+            if self.failing_polls.get(name, 0) > 0:
+                self.failing_polls[name] -= 1
+                raise exceptions.ServiceUnavailable("poll failed")
+            self.polls[name] = self.polls.get(name, 0) + 1
+            return SimpleNamespace(state=State.SUCCEEDED if self.polls[name] >= 2 else State.RUNNING)
+
+        self.compiled = False
+
+        def compile_workspace(**kwargs):
+            self.compiled = True
+            return "compilationResults/1", []
+
+        monkeypatch.setattr(run_module, "compile_workspace", compile_workspace)
+        monkeypatch.setattr(WorkflowHandler, "create_workflow_invocation", staticmethod(create_workflow_invocation))
+        monkeypatch.setattr(WorkflowHandler, "get_workflow_invocation", staticmethod(get_workflow_invocation))
+        monkeypatch.setattr(WorkflowHandler, "get_workflow_invocation_actions", staticmethod(lambda name: []))
+
+    def run(self, tags, **kwargs):
+        kwargs = dict(dict(poll_interval=0.001, max_poll_interval=0.001), **kwargs)
+        return run_module.run("p", "r", "repo", "dev", tags=tags, logger=LOGGER, **kwargs)
+
+    def test_all_invocations_succeed(self):
+        assert self.run(["daily", "hourly"])
+        assert self.polls == {"invocations/daily": 2, "invocations/hourly": 2}
+
+    def test_failed_create_keeps_tracking_started_invocations(self):
+        self.failing_creates.add("hourly")
+
+        assert not self.run(["daily", "hourly"])
+        assert self.polls == {"invocations/daily": 2}
+
+    def test_no_invocation_started(self):
+        self.failing_creates.update(["daily", "hourly"])
+
+        assert not self.run(["daily", "hourly"])
+        assert self.polls == {}
+
+    def test_failed_poll_is_retried(self):
+        self.failing_polls["invocations/daily"] = 2
+
+        assert self.run(["daily", "hourly"])
+        assert self.polls == {"invocations/daily": 2, "invocations/hourly": 2}
+
+    def test_persistently_failing_poll_is_given_up(self):
+        self.failing_polls["invocations/daily"] = run_module.MAX_POLL_FAILURES
+
+        assert not self.run(["daily", "hourly"])
+        assert self.polls == {"invocations/hourly": 2}
+
+    @pytest.mark.parametrize("poll_interval, max_poll_interval", [(0, 1), (-1, 1), (2, 1)])
+    def test_invalid_poll_intervals_are_rejected(self, poll_interval, max_poll_interval):
+        with pytest.raises(ValueError):
+            self.run(["daily"], poll_interval=poll_interval, max_poll_interval=max_poll_interval)
+
+        assert not self.compiled
+
+    def test_invalid_target_is_rejected_before_compilation(self):
+        with pytest.raises(ValueError):
+            self.run(["daily"], targets=["a.b.c.d"])
+
+        assert not self.compiled
+        assert self.polls == {}
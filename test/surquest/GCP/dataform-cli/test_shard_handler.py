@@ -0,0 +1,24 @@
+import pytest
+from src.surquest.GCP.dataform_cli.handlers.shard_handler import ShardHandler
+
+
+class TestShardHandler:
+
+    files = [f"definitions/table_{i}.sqlx" for i in range(200)]
+
+    def test_shards_partition_files(self):
+        shards = [ShardHandler(index, 4).select(self.files) for index in range(1, 5)]
+
+        assert sorted(sum(shards, [])) == sorted(self.files)
+        assert all(shard for shard in shards)
+
+    def test_assignment_is_stable(self):
+        assert ShardHandler.from_spec("2/4").select(self.files) == ShardHandler(2, 4).select(self.files)
+
+    def test_single_shard_selects_everything(self):
+        assert ShardHandler.from_spec("1/1").select(self.files) == self.files
+
+    @pytest.mark.parametrize("spec", ["0/4", "5/4", "2", "a/b", "1/0"])
+    def test_invalid_spec(self, spec):
+        with pytest.raises(ValueError):
+            ShardHandler.from_spec(spec)